@@ -13,12 +13,21 @@ def create_app(config_name=None):
     app = Flask(__name__)
     app.config.from_object(config[config_name])
 
+    from app.json_provider import OrjsonProvider
+    app.json = OrjsonProvider(app)
+
     # Initialize extensions
     from app.extensions import db, migrate, cors
     db.init_app(app)
     migrate.init_app(app, db)
     cors.init_app(app, resources={r"/api/*": {"origins": "*"}})
 
+    from app.cache import init_cache
+    init_cache(app)
+
+    from app.query_counter import init_query_counter
+    init_query_counter(app)
+
     # Register blueprints
     from app.api import api_bp
     from app.views import views_bp
@@ -26,29 +35,19 @@ def create_app(config_name=None):
     app.register_blueprint(api_bp, url_prefix='/api/v1')
     app.register_blueprint(views_bp)
 
-    # Create tables if they don't exist
-    with app.app_context():
-        db.create_all()
-
-        # One-time cleanup: strip email subjects from imported application notes
-        try:
-            from app.models import JobApplication
-            updated = JobApplication.query.filter(
-                JobApplication.notes.like('Imported from email:%'),
-                JobApplication.notes != 'Imported from email'
-            ).update(
-                {JobApplication.notes: 'Imported from email'},
-                synchronize_session=False
-            )
-            updated += JobApplication.query.filter(
-                JobApplication.notes.like('Created from response email:%')
-            ).update(
-                {JobApplication.notes: 'Imported from email'},
-                synchronize_session=False
-            )
-            if updated:
-                db.session.commit()
-        except Exception:
-            db.session.rollback()
+    from app.commands import (
+        register_commands, cleanup_imported_notes, create_missing_indexes, sync_dashboard_counters,
+    )
+    register_commands(app)
+
+    # Production creates tables at deploy time with `flask init-db` instead
+    if app.config.get('AUTO_CREATE_ALL') or app.config.get('RUN_STARTUP_MIGRATIONS'):
+        with app.app_context():
+            if app.config.get('AUTO_CREATE_ALL'):
+                db.create_all()
+            if app.config.get('RUN_STARTUP_MIGRATIONS'):
+                create_missing_indexes()
+                sync_dashboard_counters(app.config.get('DASHBOARD_AGGREGATES'))
+                cleanup_imported_notes()
 
     return app
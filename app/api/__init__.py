@@ -1,7 +1,16 @@
 """API Blueprint registration."""
 
-from flask import Blueprint
+from flask import Blueprint, g
+
+from app.services.user_service import get_current_user_id
 
 api_bp = Blueprint('api', __name__)
 
+
+@api_bp.before_request
+def load_current_user():
+    """Resolve the current user once per request and cache it on flask.g."""
+    g.user_id = get_current_user_id()
+
+
 from app.api import applications, interviews, dashboard, tags, email, contacts
@@ -1,20 +1,140 @@
 """API endpoints for job applications."""
 
-from flask import request, jsonify
+import hashlib
+from collections import defaultdict
+from flask import request, jsonify, g, current_app, abort
 from marshmallow import ValidationError
-from sqlalchemy import or_
-from datetime import datetime
+from sqlalchemy import func, or_, select, tuple_, update
+from sqlalchemy.orm import selectinload
+from datetime import datetime, date
 
 from app.api import api_bp
+from app.api.cursors import clamp_per_page, encode_cursor, decode_cursor
 from app.extensions import db
-from app.models import JobApplication, Tag
-from app.schemas import ApplicationSchema, ApplicationCreateSchema, ApplicationUpdateSchema
+from app.json_provider import stream_jsonify
+from app.models import JobApplication, Tag, InterviewStage, application_tags
+from app.models.application import touch_applications
+from app.schemas import ApplicationCreateSchema, ApplicationUpdateSchema
+
+# Schemas are stateless once built, so one instance is shared across requests
+_CREATE_SCHEMA = ApplicationCreateSchema()
+_UPDATE_SCHEMA = ApplicationUpdateSchema()
+
+VALID_STATUSES = ['applied', 'interviewing', 'offered', 'rejected', 'withdrawn', 'follow_up']
+_VALID_STATUS_SET = frozenset(VALID_STATUSES)
+
+# Sort columns that support seek pagination, mapped to the parser that turns the
+# cursor's serialized value back into a bindable Python value. Only NOT NULL
+# columns qualify: a NULL never compares true in the row-value seek, so those
+# rows would be skipped. Nullable ones (created_at, updated_at, response_date,
+# salaries) sort through page-number pagination instead.
+CURSOR_SORT_COLUMNS = {
+    'date_applied': date.fromisoformat,
+    'company_name': str,
+    'position': str,
+}
+
+# Scalar fields returned by list_applications, in JobApplication.to_dict() order.
+# The list endpoint selects these columns directly instead of hydrating ORM objects.
+LIST_FIELDS = (
+    'id', 'company_name', 'position', 'expected_salary_min', 'expected_salary_max',
+    'salary_currency', 'date_applied', 'application_url', 'job_description', 'notes',
+    'source', 'status', 'response_received', 'response_date', 'created_at', 'updated_at',
+)
+# Relationship fields appended to each list item unless excluded via `fields=`
+LIST_RELATION_FIELDS = ('interviews', 'tags')
+_SALARY_FIELDS = ('expected_salary_min', 'expected_salary_max')
+_DATE_FIELDS = ('date_applied', 'response_date', 'created_at', 'updated_at')
+
+# Bulk endpoints work through ids in chunks of this size so each statement's
+# IN list and the rows it touches stay bounded
+BULK_CHUNK_SIZE = 200
+
+
+def _chunked(seq, size=BULK_CHUNK_SIZE):
+    """Yield successive slices of seq with at most size items each."""
+    for start in range(0, len(seq), size):
+        yield seq[start:start + size]
+
+
+def iter_application_dicts(rows, fields=None):
+    """Yield list rows in the same shape as JobApplication.to_dict().
+
+    rows must expose an `id` column plus any of LIST_FIELDS. When fields is
+    given, only those keys (and `id`) are emitted, and tags/interviews are
+    only fetched if requested. Relationships for the whole page are fetched
+    up front with one query each and grouped by application id; the returned
+    generator only formats rows, so it is safe to consume after the session
+    has closed.
+    """
+    output = LIST_FIELDS + LIST_RELATION_FIELDS if fields is None else ('id',) + tuple(
+        f for f in LIST_FIELDS + LIST_RELATION_FIELDS if f in fields and f != 'id'
+    )
+    ids = [row.id for row in rows]
+    tags_by_app = defaultdict(list)
+    interviews_by_app = defaultdict(list)
+
+    if ids and 'tags' in output:
+        tag_rows = db.session.query(
+            application_tags.c.application_id, Tag.id, Tag.name, Tag.color
+        ).join(Tag, Tag.id == application_tags.c.tag_id).filter(
+            application_tags.c.application_id.in_(ids)
+        )
+        for app_id, tag_id, name, color in tag_rows:
+            tags_by_app[app_id].append({'id': tag_id, 'name': name, 'color': color})
+
+    if ids and 'interviews' in output:
+        interviews = InterviewStage.query.filter(
+            InterviewStage.application_id.in_(ids)
+        ).order_by(InterviewStage.application_id, InterviewStage.stage_number)
+        for interview in interviews:
+            interviews_by_app[interview.application_id].append(interview.to_dict())
+
+    def build(row):
+        values = row._mapping
+        data = {}
+        for field in output:
+            if field == 'tags':
+                data[field] = tags_by_app.get(row.id, [])
+            elif field == 'interviews':
+                data[field] = interviews_by_app.get(row.id, [])
+            elif field in _SALARY_FIELDS:
+                data[field] = float(values[field]) if values[field] else None
+            elif field in _DATE_FIELDS:
+                data[field] = values[field].isoformat() if values[field] else None
+            else:
+                data[field] = values[field]
+        return data
+
+    return (build(row) for row in rows)
+
+
+def list_etag(user_id, count, last_modified):
+    """Weak ETag for a filtered application list.
+
+    Combines the filtered row count and newest updated_at (which also moves
+    when an application's tags or interviews change) with the request's
+    query string, so each page/filter/projection gets its own tag.
+    """
+    key = f'{user_id}|{count}|{last_modified.isoformat() if last_modified else ""}|{request.query_string.decode()}'
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def cursor_page_etag(user_id, rows):
+    """Weak ETag for one cursor page, built from the rows it fetched.
+
+    rows are the page plus its look-ahead row, so the tag moves when any of
+    them is edited (updated_at), removed or replaced (id), or when the
+    next_cursor would change.
+    """
+    state = ','.join(f'{row.id}:{row.updated_at.isoformat() if row.updated_at else ""}' for row in rows)
+    key = f'{user_id}|{state}|{request.query_string.decode()}'
+    return hashlib.sha1(key.encode()).hexdigest()
 
 
 @api_bp.route('/applications', methods=['GET'])
 def list_applications():
     """List all applications with optional filters."""
-    from app.services.user_service import get_current_user_id
 
     # Query parameters
     status = request.args.get('status')
@@ -25,10 +145,20 @@ def list_applications():
     sort_by = request.args.get('sort_by', 'date_applied')
     sort_order = request.args.get('sort_order', 'desc')
     page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 20, type=int)
+    per_page = clamp_per_page(request.args.get('per_page', 20, type=int))
+    after = request.args.get('after')
+    fields_param = request.args.get('fields')
+
+    # Optional projection: fields=id,company_name,status,tags
+    fields = None
+    if fields_param:
+        fields = {f.strip() for f in fields_param.split(',') if f.strip()}
+        unknown = fields - set(LIST_FIELDS) - set(LIST_RELATION_FIELDS)
+        if unknown:
+            return jsonify({'error': f'Unknown fields: {sorted(unknown)}'}), 400
 
     # Build query - filter by current user
-    user_id = get_current_user_id()
+    user_id = g.user_id
     query = JobApplication.query.filter_by(user_id=user_id)
 
     # Apply filters
@@ -39,6 +169,13 @@ def list_applications():
     if company:
         query = query.filter(JobApplication.company_name.ilike(f'%{company}%'))
 
+    # Parse date bounds once here so malformed input is a 400, not a DB error
+    try:
+        from_date = date.fromisoformat(from_date) if from_date else None
+        to_date = date.fromisoformat(to_date) if to_date else None
+    except ValueError:
+        return jsonify({'error': 'from_date and to_date must be YYYY-MM-DD'}), 400
+
     if from_date:
         query = query.filter(JobApplication.date_applied >= from_date)
 
@@ -48,48 +185,122 @@ def list_applications():
     if response_received is not None:
         query = query.filter(JobApplication.response_received == (response_received.lower() == 'true'))
 
-    # Apply sorting
     sort_column = getattr(JobApplication, sort_by, JobApplication.date_applied)
-    if sort_order == 'desc':
-        query = query.order_by(sort_column.desc())
+    use_cursor = after is not None
+
+    if not use_cursor:
+        # Fingerprint the filtered set so unchanged polls get a 304 before any
+        # rows are fetched or serialized. If-Modified-Since alone is not honored:
+        # a deletion lowers the count without moving MAX(updated_at). Cursor
+        # pages skip this whole-set COUNT/MAX and fingerprint their own rows.
+        total, last_modified = query.with_entities(
+            func.count(JobApplication.id), func.max(JobApplication.updated_at)
+        ).one()
+        etag = list_etag(user_id, total, last_modified)
+        if request.if_none_match.contains_weak(etag):
+            response = current_app.response_class(status=304)
+            response.set_etag(etag, weak=True)
+            return response
+
+    # Only the scalar columns needed for the response (plus id, and for cursors
+    # the sort key and updated_at) are selected; tags and interviews are
+    # batch-loaded by iter_application_dicts.
+    selected = [
+        f for f in LIST_FIELDS
+        if fields is None or f in fields or f == 'id' or (use_cursor and f in (sort_by, 'updated_at'))
+    ]
+    query = query.with_entities(*(getattr(JobApplication, f) for f in selected))
+
+    # Seek pagination: filter past the cursor's (sort value, id) and fetch one
+    # extra row to learn whether another page exists. Cost is independent of
+    # how deep the client has paged.
+    if use_cursor:
+        if sort_by not in CURSOR_SORT_COLUMNS:
+            return jsonify({'error': f'Cursor pagination is not supported for sort_by={sort_by}'}), 400
+        if after:
+            try:
+                cursor_value, cursor_id = decode_cursor(after, CURSOR_SORT_COLUMNS[sort_by])
+            except ValueError as err:
+                return jsonify({'error': str(err)}), 400
+            row_key = tuple_(sort_column, JobApplication.id)
+            if sort_order == 'desc':
+                query = query.filter(row_key < (cursor_value, cursor_id))
+            else:
+                query = query.filter(row_key > (cursor_value, cursor_id))
+
+        if sort_order == 'desc':
+            query = query.order_by(sort_column.desc(), JobApplication.id.desc())
+        else:
+            query = query.order_by(sort_column.asc(), JobApplication.id.asc())
+
+        items = query.limit(per_page + 1).all()
+        etag = cursor_page_etag(user_id, items)
+        last_modified = max((row.updated_at for row in items if row.updated_at), default=None)
+        if request.if_none_match.contains_weak(etag):
+            response = current_app.response_class(status=304)
+            response.set_etag(etag, weak=True)
+            return response
+
+        has_more = len(items) > per_page
+        items = items[:per_page]
+        next_cursor = None
+        if has_more and items:
+            last = items[-1]
+            next_cursor = encode_cursor(getattr(last, sort_by), last.id)
+
+        response = stream_jsonify({
+            'applications': iter_application_dicts(items, fields),
+            'next_cursor': next_cursor,
+            'per_page': per_page,
+        }, 'applications')
     else:
-        query = query.order_by(sort_column.asc())
-
-    # Paginate
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
-
-    return jsonify({
-        'applications': [app.to_dict() for app in pagination.items],
-        'total': pagination.total,
-        'pages': pagination.pages,
-        'current_page': page,
-        'per_page': per_page,
-    })
+        # Legacy page-number pagination. OFFSET scans and discards every
+        # earlier row, so cost grows with page depth; prefer the `after`
+        # cursor for large result sets. The fingerprint's count doubles as
+        # the total, so paginate() skips its own COUNT(*).
+        if sort_order == 'desc':
+            query = query.order_by(sort_column.desc())
+        else:
+            query = query.order_by(sort_column.asc())
+
+        pagination = query.paginate(page=page, per_page=per_page, error_out=False, count=False)
+        pagination.total = total
+
+        response = stream_jsonify({
+            'applications': iter_application_dicts(pagination.items, fields),
+            'total': pagination.total,
+            'pages': pagination.pages,
+            'current_page': page,
+            'per_page': per_page,
+        }, 'applications')
+
+    response.set_etag(etag, weak=True)
+    if last_modified:
+        response.last_modified = last_modified
+    return response
 
 
 @api_bp.route('/applications/<int:id>', methods=['GET'])
 def get_application(id):
     """Get a single application by ID."""
-    from app.services.user_service import get_current_user_id
-    user_id = get_current_user_id()
-    application = JobApplication.query.filter_by(id=id, user_id=user_id).first_or_404()
+    user_id = g.user_id
+    application = JobApplication.query.options(
+        selectinload(JobApplication.interviews)
+    ).filter_by(id=id, user_id=user_id).first_or_404()
     return jsonify(application.to_dict())
 
 
 @api_bp.route('/applications', methods=['POST'])
 def create_application():
     """Create a new application."""
-    from app.services.user_service import get_current_user_id
-
-    schema = ApplicationCreateSchema()
 
     try:
-        data = schema.load(request.json)
+        data = _CREATE_SCHEMA.load(request.json)
     except ValidationError as err:
         return jsonify({'errors': err.messages}), 400
 
     # Add current user ID
-    data['user_id'] = get_current_user_id()
+    data['user_id'] = g.user_id
 
     application = JobApplication(**data)
     db.session.add(application)
@@ -101,29 +312,42 @@ def create_application():
 @api_bp.route('/applications/<int:id>', methods=['PUT'])
 def update_application(id):
     """Update an existing application."""
-    from app.services.user_service import get_current_user_id
-    user_id = get_current_user_id()
-    application = JobApplication.query.filter_by(id=id, user_id=user_id).first_or_404()
-    schema = ApplicationUpdateSchema()
+    user_id = g.user_id
 
     try:
-        data = schema.load(request.json)
+        data = _UPDATE_SCHEMA.load(request.json)
     except ValidationError as err:
         return jsonify({'errors': err.messages}), 400
 
-    for key, value in data.items():
-        setattr(application, key, value)
-
+    if data and db.session.get_bind().dialect.update_returning:
+        # One UPDATE ... RETURNING instead of a SELECT followed by an UPDATE
+        application = db.session.execute(
+            update(JobApplication)
+            .where(JobApplication.id == id, JobApplication.user_id == user_id)
+            .values(**data)
+            .returning(JobApplication),
+            execution_options={'synchronize_session': False}
+        ).scalar_one_or_none()
+        if application is None:
+            abort(404)
+    else:
+        application = JobApplication.query.filter_by(id=id, user_id=user_id).first_or_404()
+        for key, value in data.items():
+            setattr(application, key, value)
+        # Apply the UPDATE (and updated_at's onupdate) so the response reflects it
+        db.session.flush()
+
+    # Serialize before commit so expire_on_commit doesn't force a reload
+    result = application.to_dict()
     db.session.commit()
 
-    return jsonify(application.to_dict())
+    return jsonify(result)
 
 
 @api_bp.route('/applications/<int:id>/notes', methods=['PATCH'])
 def update_application_notes(id):
     """Update only the notes of an application."""
-    from app.services.user_service import get_current_user_id
-    user_id = get_current_user_id()
+    user_id = g.user_id
     application = JobApplication.query.filter_by(id=id, user_id=user_id).first_or_404()
 
     data = request.json
@@ -139,17 +363,15 @@ def update_application_notes(id):
 @api_bp.route('/applications/<int:id>/status', methods=['PATCH'])
 def update_application_status(id):
     """Update only the status of an application."""
-    from app.services.user_service import get_current_user_id
-    user_id = get_current_user_id()
+    user_id = g.user_id
     application = JobApplication.query.filter_by(id=id, user_id=user_id).first_or_404()
 
     data = request.json
     if 'status' not in data:
         return jsonify({'error': 'status field is required'}), 400
 
-    valid_statuses = ['applied', 'interviewing', 'offered', 'rejected', 'withdrawn', 'follow_up']
-    if data['status'] not in valid_statuses:
-        return jsonify({'error': f'Invalid status. Must be one of: {valid_statuses}'}), 400
+    if data['status'] not in _VALID_STATUS_SET:
+        return jsonify({'error': f'Invalid status. Must be one of: {VALID_STATUSES}'}), 400
 
     application.status = data['status']
 
@@ -166,8 +388,7 @@ def update_application_status(id):
 @api_bp.route('/applications/<int:id>', methods=['DELETE'])
 def delete_application(id):
     """Delete an application."""
-    from app.services.user_service import get_current_user_id
-    user_id = get_current_user_id()
+    user_id = g.user_id
     application = JobApplication.query.filter_by(id=id, user_id=user_id).first_or_404()
     db.session.delete(application)
     db.session.commit()
@@ -182,26 +403,24 @@ def delete_application(id):
 @api_bp.route('/applications/delete-all', methods=['DELETE'])
 def delete_all_applications():
     """Delete all applications for current user."""
-    from app.services.user_service import get_current_user_id
-    from app.models import Contact, InterviewStage, ParsedEmail
-    from app.models.tag import application_tags
-    user_id = get_current_user_id()
+    from app.models import Contact, ParsedEmail
+    user_id = g.user_id
 
     try:
-        app_ids = [a.id for a in JobApplication.query.filter_by(user_id=user_id).with_entities(JobApplication.id).all()]
-        count = len(app_ids)
-
-        if app_ids:
-            # Delete related records first (bulk delete bypasses ORM cascades)
-            InterviewStage.query.filter(InterviewStage.application_id.in_(app_ids)).delete(synchronize_session=False)
-            Contact.query.filter(Contact.application_id.in_(app_ids)).delete(synchronize_session=False)
-            # Unlink parsed emails (don't delete them, just clear the reference)
-            ParsedEmail.query.filter(ParsedEmail.application_id.in_(app_ids)).update(
-                {ParsedEmail.application_id: None, ParsedEmail.status: 'pending'}, synchronize_session=False)
-            # Delete tag associations
-            db.session.execute(application_tags.delete().where(application_tags.c.application_id.in_(app_ids)))
-            # Now delete applications
-            JobApplication.query.filter_by(user_id=user_id).delete(synchronize_session=False)
+        # Children are deleted through an id subquery so no application rows
+        # are loaded into Python; the final DELETE's rowcount is the total.
+        app_ids = select(JobApplication.id).where(JobApplication.user_id == user_id)
+
+        # Delete related records first (bulk delete bypasses ORM cascades)
+        InterviewStage.query.filter(InterviewStage.application_id.in_(app_ids)).delete(synchronize_session=False)
+        Contact.query.filter(Contact.application_id.in_(app_ids)).delete(synchronize_session=False)
+        # Unlink parsed emails (don't delete them, just clear the reference)
+        ParsedEmail.query.filter(ParsedEmail.application_id.in_(app_ids)).update(
+            {ParsedEmail.application_id: None, ParsedEmail.status: 'pending'}, synchronize_session=False)
+        # Delete tag associations
+        db.session.execute(application_tags.delete().where(application_tags.c.application_id.in_(app_ids)))
+        # Now delete applications
+        count = JobApplication.query.filter_by(user_id=user_id).delete(synchronize_session=False)
 
         db.session.commit()
         return jsonify({'message': f'Deleted {count} applications', 'deleted': count}), 200
@@ -214,9 +433,8 @@ def delete_all_applications():
 @api_bp.route('/applications/bulk/delete', methods=['POST'])
 def bulk_delete_applications():
     """Delete multiple applications by ID."""
-    from app.services.user_service import get_current_user_id
-    from app.models import Contact, InterviewStage, ParsedEmail
-    user_id = get_current_user_id()
+    from app.models import Contact, ParsedEmail
+    user_id = g.user_id
 
     if not user_id:
         return jsonify({'error': 'Please sign in first'}), 401
@@ -233,27 +451,29 @@ def bulk_delete_applications():
         return jsonify({'error': 'Cannot delete more than 500 applications at once'}), 400
 
     try:
-        # Get the applications that will be deleted (to ensure user owns them)
-        applications = JobApplication.query.filter(
-            JobApplication.id.in_(ids),
-            JobApplication.user_id == user_id
-        ).all()
+        # Set-based deletes per chunk: the ownership check lives in the id
+        # subquery, and no ORM objects are loaded or flushed one by one.
+        count = 0
+        for chunk in _chunked(ids):
+            app_ids = select(JobApplication.id).where(
+                JobApplication.id.in_(chunk),
+                JobApplication.user_id == user_id
+            )
+            InterviewStage.query.filter(InterviewStage.application_id.in_(app_ids)).delete(synchronize_session=False)
+            Contact.query.filter(Contact.application_id.in_(app_ids)).delete(synchronize_session=False)
+            # Unlink parsed emails (don't delete them, just clear the reference)
+            ParsedEmail.query.filter(ParsedEmail.application_id.in_(app_ids)).update(
+                {ParsedEmail.application_id: None}, synchronize_session=False)
+            db.session.execute(application_tags.delete().where(application_tags.c.application_id.in_(app_ids)))
+            count += JobApplication.query.filter(
+                JobApplication.id.in_(chunk),
+                JobApplication.user_id == user_id
+            ).delete(synchronize_session=False)
 
-        if not applications:
+        if not count:
+            db.session.rollback()
             return jsonify({'error': 'No matching applications found'}), 404
 
-        app_ids = [app.id for app in applications]
-
-        # Clear tags association first (many-to-many doesn't cascade automatically)
-        for app in applications:
-            app.tags = []
-
-        # Delete each application (this triggers ORM cascade for related records)
-        count = 0
-        for app in applications:
-            db.session.delete(app)
-            count += 1
-
         db.session.commit()
 
         return jsonify({'message': f'Deleted {count} applications', 'deleted': count}), 200
@@ -267,42 +487,50 @@ def bulk_delete_applications():
 @api_bp.route('/applications/bulk/status', methods=['PATCH'])
 def bulk_update_status():
     """Update status for multiple applications."""
-    from app.services.user_service import get_current_user_id
-    user_id = get_current_user_id()
+    user_id = g.user_id
 
     data = request.json
     if not data or 'ids' not in data or 'status' not in data:
         return jsonify({'error': 'ids and status fields are required'}), 400
 
-    valid_statuses = ['applied', 'interviewing', 'offered', 'rejected', 'withdrawn', 'follow_up']
-    if data['status'] not in valid_statuses:
-        return jsonify({'error': f'Invalid status. Must be one of: {valid_statuses}'}), 400
+    if data['status'] not in _VALID_STATUS_SET:
+        return jsonify({'error': f'Invalid status. Must be one of: {VALID_STATUSES}'}), 400
 
     ids = data['ids']
     if len(ids) > 500:
         return jsonify({'error': 'Cannot update more than 500 applications at once'}), 400
 
-    applications = JobApplication.query.filter(
-        JobApplication.id.in_(ids),
-        JobApplication.user_id == user_id
-    ).all()
-
-    for app in applications:
-        app.status = data['status']
-        if data['status'] != 'applied' and not app.response_received:
-            app.response_received = True
-            app.response_date = datetime.utcnow().date()
+    # Set-based UPDATEs per chunk instead of loading every row into the session
+    today = datetime.utcnow().date()
+    updated = 0
+    for chunk in _chunked(ids):
+        owned = (JobApplication.id.in_(chunk), JobApplication.user_id == user_id)
+
+        # Any status other than 'applied' means a response was received
+        if data['status'] != 'applied':
+            db.session.execute(
+                update(JobApplication).where(
+                    *owned,
+                    or_(JobApplication.response_received == False, JobApplication.response_received.is_(None))
+                ).values(response_received=True, response_date=today),
+                execution_options={'synchronize_session': False}
+            )
+
+        result = db.session.execute(
+            update(JobApplication).where(*owned).values(status=data['status']),
+            execution_options={'synchronize_session': False}
+        )
+        updated += result.rowcount
 
     db.session.commit()
 
-    return jsonify({'message': f'Updated {len(applications)} applications', 'updated': len(applications)}), 200
+    return jsonify({'message': f'Updated {updated} applications', 'updated': updated}), 200
 
 
 @api_bp.route('/applications/fix-response-received', methods=['POST'])
 def fix_response_received():
     """Retroactively mark response_received=True for all applications with non-applied status."""
-    from app.services.user_service import get_current_user_id
-    user_id = get_current_user_id()
+    user_id = g.user_id
 
     applications = JobApplication.query.filter(
         JobApplication.user_id == user_id,
@@ -323,8 +551,7 @@ def fix_response_received():
 @api_bp.route('/applications/bulk/tags', methods=['POST'])
 def bulk_add_tags():
     """Add tags to multiple applications."""
-    from app.services.user_service import get_current_user_id
-    user_id = get_current_user_id()
+    user_id = g.user_id
 
     data = request.json
     if not data or 'ids' not in data or 'tag_ids' not in data:
@@ -336,31 +563,54 @@ def bulk_add_tags():
     if len(ids) > 500:
         return jsonify({'error': 'Cannot update more than 500 applications at once'}), 400
 
-    applications = JobApplication.query.filter(
-        JobApplication.id.in_(ids),
-        JobApplication.user_id == user_id
-    ).all()
-
-    tags = Tag.query.filter(
+    valid_tag_ids = [row.id for row in Tag.query.with_entities(Tag.id).filter(
         Tag.id.in_(tag_ids),
         Tag.user_id == user_id
-    ).all()
+    )]
 
-    if not tags:
+    if not valid_tag_ids:
         return jsonify({'error': 'No valid tags found'}), 400
 
+    # Per chunk of applications: look up existing links once, then insert the
+    # missing pairs straight into the association table instead of loading
+    # and appending to each app.tags
+    updated = 0
     count = 0
-    for app in applications:
-        for tag in tags:
-            if tag not in app.tags:
-                app.tags.append(tag)
-                count += 1
+    for chunk in _chunked(ids):
+        app_ids = [row.id for row in JobApplication.query.with_entities(JobApplication.id).filter(
+            JobApplication.id.in_(chunk),
+            JobApplication.user_id == user_id
+        )]
+        if not app_ids:
+            continue
+
+        existing = set(db.session.query(
+            application_tags.c.application_id, application_tags.c.tag_id
+        ).filter(
+            application_tags.c.application_id.in_(app_ids),
+            application_tags.c.tag_id.in_(valid_tag_ids)
+        ).all())
+
+        rows = [
+            {'application_id': app_id, 'tag_id': tag_id}
+            for app_id in app_ids
+            for tag_id in valid_tag_ids
+            if (app_id, tag_id) not in existing
+        ]
+        if rows:
+            db.session.execute(application_tags.insert(), rows)
+            touch_applications(
+                db.session.connection(),
+                JobApplication.id.in_({row['application_id'] for row in rows})
+            )
+        updated += len(app_ids)
+        count += len(rows)
 
     db.session.commit()
 
     return jsonify({
-        'message': f'Added tags to {len(applications)} applications',
-        'updated': len(applications),
+        'message': f'Added tags to {updated} applications',
+        'updated': updated,
         'tags_added': count
     }), 200
 
@@ -368,8 +618,7 @@ def bulk_add_tags():
 @api_bp.route('/applications/<int:id>/tags/<int:tag_id>', methods=['POST'])
 def add_tag_to_application(id, tag_id):
     """Add a tag to an application."""
-    from app.services.user_service import get_current_user_id
-    user_id = get_current_user_id()
+    user_id = g.user_id
     application = JobApplication.query.filter_by(id=id, user_id=user_id).first_or_404()
     tag = Tag.query.filter_by(id=tag_id, user_id=user_id).first_or_404()
 
@@ -383,8 +632,7 @@ def add_tag_to_application(id, tag_id):
 @api_bp.route('/applications/<int:id>/tags/<int:tag_id>', methods=['DELETE'])
 def remove_tag_from_application(id, tag_id):
     """Remove a tag from an application."""
-    from app.services.user_service import get_current_user_id
-    user_id = get_current_user_id()
+    user_id = g.user_id
     application = JobApplication.query.filter_by(id=id, user_id=user_id).first_or_404()
     tag = Tag.query.filter_by(id=tag_id, user_id=user_id).first_or_404()
 
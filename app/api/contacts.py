@@ -1,18 +1,16 @@
 """API endpoints for contacts/connections."""
 
-from flask import request, jsonify
+from flask import request, jsonify, g
+from sqlalchemy import func
+from sqlalchemy.orm import lazyload, selectinload
 from app.api import api_bp
+from app.api.cursors import clamp_per_page, encode_cursor, decode_cursor
 from app.extensions import db
 from app.models import Contact, JobApplication
-from app.services.user_service import get_current_user_id
 
 
-@api_bp.route('/contacts', methods=['GET'])
-def get_contacts():
-    """Get all contacts/connections for current user."""
-    user_id = get_current_user_id()
-
-    # Optional filtering
+def _filtered_contacts(user_id):
+    """Base contact query for the current user with optional filters applied."""
     source = request.args.get('source')  # 'manual', 'email_scan'
     company = request.args.get('company')
 
@@ -22,20 +20,61 @@ def get_contacts():
         query = query.filter(Contact.source == source)
     if company:
         query = query.filter(Contact.company.ilike(f'%{company}%'))
+    return query
 
-    # Order by most recent first
-    contacts = query.order_by(Contact.created_at.desc()).all()
+
+@api_bp.route('/contacts', methods=['GET'])
+def get_contacts():
+    """Get a page of contacts/connections for current user, newest first.
+
+    Pages are cursor-based: pass the previous response's `next_cursor` as
+    `after` to fetch the next page. `next_cursor` is null on the last page.
+    """
+    user_id = g.user_id
+    per_page = clamp_per_page(request.args.get('per_page', 50, type=int))
+    after = request.args.get('after')
+
+    # to_dict only reads the application's company name, so stop the
+    # load from cascading into JobApplication.tags' own selectin query
+    query = _filtered_contacts(user_id).options(
+        selectinload(Contact.application).lazyload(JobApplication.tags)
+    )
+
+    # Pages are keyed on id alone: ids only grow, so descending id is newest
+    # first, and unlike the nullable created_at it can't drop rows or yield
+    # a cursor that fails to decode
+    if after:
+        try:
+            _, cursor_id = decode_cursor(after, lambda value: value)
+        except ValueError as err:
+            return jsonify({'error': str(err)}), 400
+        query = query.filter(Contact.id < cursor_id)
+
+    # Fetch one extra row to learn whether another page exists
+    contacts = query.order_by(Contact.id.desc()).limit(per_page + 1).all()
+    next_cursor = None
+    if len(contacts) > per_page:
+        contacts = contacts[:per_page]
+        next_cursor = encode_cursor(None, contacts[-1].id)
 
     return jsonify({
         'contacts': [c.to_dict() for c in contacts],
-        'total': len(contacts)
+        'next_cursor': next_cursor,
+        'per_page': per_page,
     })
 
 
+@api_bp.route('/contacts/count', methods=['GET'])
+def count_contacts():
+    """Count contacts for current user, honoring the same filters as the list."""
+    total = _filtered_contacts(g.user_id).with_entities(func.count(Contact.id)).scalar()
+    return jsonify({'total': total})
+
+
 @api_bp.route('/contacts/<int:contact_id>', methods=['GET'])
 def get_contact(contact_id):
     """Get a single contact."""
-    user_id = get_current_user_id()
+    user_id = g.user_id
     contact = Contact.query.filter_by(id=contact_id, user_id=user_id).first_or_404()
     return jsonify(contact.to_dict())
 
@@ -43,7 +82,7 @@ def get_contact(contact_id):
 @api_bp.route('/contacts', methods=['POST'])
 def create_contact():
     """Create a new contact."""
-    user_id = get_current_user_id()
+    user_id = g.user_id
     data = request.get_json() or {}
 
     if not data.get('name'):
@@ -71,7 +110,7 @@ def create_contact():
 @api_bp.route('/contacts/<int:contact_id>', methods=['PATCH'])
 def update_contact(contact_id):
     """Update a contact."""
-    user_id = get_current_user_id()
+    user_id = g.user_id
     contact = Contact.query.filter_by(id=contact_id, user_id=user_id).first_or_404()
     data = request.get_json() or {}
 
@@ -101,7 +140,7 @@ def update_contact(contact_id):
 @api_bp.route('/contacts/<int:contact_id>', methods=['DELETE'])
 def delete_contact(contact_id):
     """Delete a contact."""
-    user_id = get_current_user_id()
+    user_id = g.user_id
     contact = Contact.query.filter_by(id=contact_id, user_id=user_id).first_or_404()
 
     db.session.delete(contact)
@@ -113,7 +152,7 @@ def delete_contact(contact_id):
 @api_bp.route('/applications/<int:app_id>/contacts', methods=['GET'])
 def get_application_contacts(app_id):
     """Get all contacts for a specific application."""
-    user_id = get_current_user_id()
+    user_id = g.user_id
     application = JobApplication.query.filter_by(id=app_id, user_id=user_id).first_or_404()
     contacts = Contact.query.filter_by(application_id=app_id, user_id=user_id).all()
 
@@ -0,0 +1,42 @@
+"""Opaque cursors for seek (keyset) pagination."""
+
+import base64
+import json
+
+# Largest page a list endpoint returns, whatever per_page asks for
+MAX_PER_PAGE = 100
+
+
+def encode_cursor(sort_value, row_id):
+    """Encode a (sort value, id) pair as an opaque URL-safe cursor."""
+    if hasattr(sort_value, 'isoformat'):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor, parse_value):
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: The cursor string from the client.
+        parse_value: Turns the serialized sort value back into a bindable
+            Python value (e.g. date.fromisoformat).
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return parse_value(sort_value), int(row_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError('Invalid cursor') from e
+
+
+def clamp_per_page(per_page):
+    """Bound a client-supplied per_page to 1..MAX_PER_PAGE.
+
+    Zero would leave an over-fetched page empty, and a negative LIMIT means
+    "no limit" on SQLite and is an error on PostgreSQL.
+    """
+    return max(1, min(per_page, MAX_PER_PAGE))
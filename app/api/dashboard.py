@@ -1,136 +1,286 @@
 """API endpoints for dashboard statistics."""
 
-from flask import jsonify
-from sqlalchemy import func
-from datetime import datetime, timedelta
+import hashlib
+from functools import wraps
+from flask import jsonify, current_app, request
+from sqlalchemy import Date, DateTime, Integer, case, cast, event, func, literal, null, select, true
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta, timezone
 
 from app.api import api_bp
+from app.cache import cached_json, cache_delete
 from app.extensions import db
 from app.models import JobApplication, InterviewStage
+from app.models.dashboard import (
+    dashboard_stats_view, timeline_daily_view, application_counters, dashboard_refresh,
+)
 
+# Statuses reported in the dashboard's status breakdown, in display order
+STATUS_BUCKETS = ('applied', 'interviewing', 'offered', 'rejected', 'withdrawn')
 
-@api_bp.route('/dashboard/stats', methods=['GET'])
-def get_dashboard_stats():
-    """Get summary statistics for the dashboard."""
+# Funnel interview rows: (label, minimum highest stage reached). Deeper
+# funnels only need another entry here.
+FUNNEL_INTERVIEW_STAGES = (
+    ('1st Interview', 1),
+    ('2nd Interview', 2),
+    ('3rd+ Interview', 3),
+)
 
-    # Total applications
-    total = JobApplication.query.count()
+DASHBOARD_CACHE_KEYS = ('dash:stats', 'dash:timeline', 'dash:funnel')
+_DASHBOARD_TABLES = frozenset({JobApplication.__tablename__, InterviewStage.__tablename__})
 
-    # Applications by status
-    status_counts = db.session.query(
-        JobApplication.status,
-        func.count(JobApplication.id)
-    ).group_by(JobApplication.status).all()
 
-    status_dict = {status: count for status, count in status_counts}
+# Cached dashboard responses are dropped once a transaction that wrote
+# applications or interviews commits. Flushed ORM objects are caught in
+# before_flush; set-based UPDATE/DELETE statements in do_orm_execute.
+@event.listens_for(Session, 'before_flush')
+def _note_dashboard_writes(session, flush_context, instances):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, (JobApplication, InterviewStage)):
+            session.info['dashboard_stale'] = True
+            return
 
-    # Response rate
-    with_response = JobApplication.query.filter_by(response_received=True).count()
-    response_rate = (with_response / total * 100) if total > 0 else 0
 
-    # Applications in last 7 days
-    week_ago = datetime.utcnow().date() - timedelta(days=7)
-    recent_applications = JobApplication.query.filter(
-        JobApplication.date_applied >= week_ago
-    ).count()
+@event.listens_for(Session, 'do_orm_execute')
+def _note_dashboard_statements(orm_execute_state):
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        table = getattr(orm_execute_state.statement, 'table', None)
+        if getattr(table, 'name', None) in _DASHBOARD_TABLES:
+            orm_execute_state.session.info['dashboard_stale'] = True
 
-    # Applications in last 30 days
-    month_ago = datetime.utcnow().date() - timedelta(days=30)
-    monthly_applications = JobApplication.query.filter(
-        JobApplication.date_applied >= month_ago
-    ).count()
 
-    # Upcoming interviews (scheduled but not completed)
-    upcoming_interviews = InterviewStage.query.filter(
-        InterviewStage.scheduled_date >= datetime.utcnow(),
+@event.listens_for(Session, 'after_commit')
+def _invalidate_dashboard_cache(session):
+    if session.info.pop('dashboard_stale', False):
+        cache_delete(*DASHBOARD_CACHE_KEYS)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_dashboard_writes(session):
+    session.info.pop('dashboard_stale', None)
+
+
+def _read_engine():
+    """Engine for dashboard reads: the read replica when one is configured."""
+    return db.engines.get('replica', db.engine)
+
+
+def _read(statement):
+    """Execute a dashboard query on the read engine, off the primary's pool."""
+    return db.session.execute(statement, bind_arguments={'bind': _read_engine()})
+
+
+def _aggregate_strategy():
+    """Where dashboard figures come from: 'live', 'materialized' or 'counters'.
+
+    The pre-aggregated strategies exist only on PostgreSQL; anything else
+    reads the live tables.
+    """
+    if _read_engine().dialect.name != 'postgresql':
+        return 'live'
+    return current_app.config.get('DASHBOARD_AGGREGATES', 'live')
+
+
+def _application_counts_source():
+    """Pick the rows application figures are summed over.
+
+    Returns:
+        tuple: (columns, weight) where columns exposes status,
+        response_received and date_applied, and weight is how many
+        applications each row stands for.
+    """
+    strategy = _aggregate_strategy()
+    if strategy == 'materialized':
+        return dashboard_stats_view.c, dashboard_stats_view.c.app_count
+    if strategy == 'counters':
+        return application_counters.c, application_counters.c.app_count
+    return JobApplication.__table__.c, literal(1)
+
+
+def _upcoming_interviews(now):
+    """Scalar subquery counting interviews scheduled after now and not completed."""
+    return select(func.count(InterviewStage.id)).where(
+        # scheduled_date is stored as naive UTC, so compare against a naive value
+        InterviewStage.scheduled_date >= now.replace(tzinfo=None),
         InterviewStage.completed_date.is_(None)
-    ).count()
+    ).scalar_subquery()
+
+
+def _views_refreshed_at():
+    """When the materialized views were last refreshed, if they feed the dashboard."""
+    if _aggregate_strategy() != 'materialized':
+        return null()
+    return select(dashboard_refresh.c.refreshed_at).scalar_subquery()
+
+
+def _dashboard_fingerprint():
+    """Cheap summary that changes whenever any dashboard figure can.
 
-    # Interview conversion rate (applications that reached interview stage)
-    apps_with_interviews = db.session.query(
-        func.count(func.distinct(InterviewStage.application_id))
-    ).scalar() or 0
-    interview_rate = (apps_with_interviews / total * 100) if total > 0 else 0
+    Interview writes bump their application's updated_at, and deletes move
+    the count. Today's date covers the rolling 7/30-day windows, and the
+    upcoming-interview count covers interviews slipping into the past.
+    With materialized views the figures only move on a refresh, so the
+    refresh time is part of the key too.
+
+    Returns:
+        tuple: (etag, last_modified) for the current request path.
+    """
+    now = datetime.now(timezone.utc)
+    count, last_modified, upcoming, refreshed_at = _read(select(
+        func.count(JobApplication.id),
+        func.max(JobApplication.updated_at),
+        _upcoming_interviews(now),
+        _views_refreshed_at(),
+    )).one()
+    key = f'{request.path}|{now.date()}|{count}|{last_modified}|{upcoming}|{refreshed_at}'
+    if refreshed_at is not None:
+        last_modified = refreshed_at
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest(), last_modified
+
+
+def conditional_dashboard(view):
+    """Answer If-None-Match with 304 before computing or fetching the payload."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        etag, last_modified = _dashboard_fingerprint()
+        if request.if_none_match.contains_weak(etag):
+            response = current_app.response_class(status=304)
+        else:
+            response = current_app.make_response(view(*args, **kwargs))
+            if last_modified:
+                response.last_modified = last_modified
+        response.set_etag(etag, weak=True)
+        return response
+    return wrapper
+
+
+def _sum_where(condition, weight):
+    """Conditional SUM aggregate: total weight of rows matching condition."""
+    # the cast keeps Postgres from widening SUM(bigint) to numeric
+    return cast(func.coalesce(func.sum(case((condition, weight), else_=0)), 0), Integer)
+
+
+@api_bp.route('/dashboard/stats', methods=['GET'])
+@conditional_dashboard
+@cached_json('dash:stats', 'DASHBOARD_CACHE_TTL')
+def get_dashboard_stats():
+    """Get summary statistics for the dashboard."""
+    now = datetime.now(timezone.utc)
+    today = now.date()
+    week_ago = today - timedelta(days=7)
+    month_ago = today - timedelta(days=30)
+
+    # Upcoming interviews (scheduled but not completed)
+    upcoming_interviews_sq = _upcoming_interviews(now)
+
+    # Applications that reached an interview stage. Counting GROUP BY groups
+    # lets Postgres walk the (application_id, stage_number) index instead of
+    # hashing every row for COUNT(DISTINCT ...).
+    interviewed_apps = select(InterviewStage.application_id).group_by(InterviewStage.application_id).subquery()
+    apps_with_interviews_sq = select(func.count()).select_from(interviewed_apps).scalar_subquery()
+
+    # Every figure comes back in one row from a single round-trip
+    columns, weight = _application_counts_source()
+    status_columns = [_sum_where(columns.status == status, weight).label(status) for status in STATUS_BUCKETS]
+    stats = _read(select(
+        _sum_where(true(), weight).label('total'),
+        _sum_where(columns.response_received.is_(True), weight).label('with_response'),
+        _sum_where(columns.date_applied >= week_ago, weight).label('last_7_days'),
+        _sum_where(columns.date_applied >= month_ago, weight).label('last_30_days'),
+        *status_columns,
+        upcoming_interviews_sq.label('upcoming_interviews'),
+        apps_with_interviews_sq.label('apps_with_interviews'),
+    ).select_from(columns.status.table)).one()
+
+    total = stats.total
+    response_rate = (stats.with_response / total * 100) if total > 0 else 0
+    interview_rate = ((stats.apps_with_interviews or 0) / total * 100) if total > 0 else 0
 
     return jsonify({
         'total_applications': total,
-        'status_breakdown': {
-            'applied': status_dict.get('applied', 0),
-            'interviewing': status_dict.get('interviewing', 0),
-            'offered': status_dict.get('offered', 0),
-            'rejected': status_dict.get('rejected', 0),
-            'withdrawn': status_dict.get('withdrawn', 0),
-        },
+        'status_breakdown': {status: stats._mapping[status] for status in STATUS_BUCKETS},
         'response_rate': round(response_rate, 1),
         'interview_rate': round(interview_rate, 1),
         'recent_applications': {
-            'last_7_days': recent_applications,
-            'last_30_days': monthly_applications,
+            'last_7_days': stats.last_7_days,
+            'last_30_days': stats.last_30_days,
         },
-        'upcoming_interviews': upcoming_interviews,
+        'upcoming_interviews': stats.upcoming_interviews,
     })
 
 
 @api_bp.route('/dashboard/timeline', methods=['GET'])
+@conditional_dashboard
+@cached_json('dash:timeline', 'DASHBOARD_CACHE_TTL')
 def get_application_timeline():
-    """Get applications over time for charting."""
+    """Get daily application counts for the last 30 days, including empty days."""
+    today = datetime.now(timezone.utc).date()
+    thirty_days_ago = today - timedelta(days=30)
 
-    # Get daily counts for last 30 days
-    thirty_days_ago = datetime.utcnow().date() - timedelta(days=30)
+    if _aggregate_strategy() == 'materialized':
+        columns, weight = timeline_daily_view.c, timeline_daily_view.c.app_count
+    else:
+        columns, weight = _application_counts_source()
+    daily_counts = select(
+        columns.date_applied.label('day'),
+        _sum_where(true(), weight).label('count')
+    ).where(columns.date_applied >= thirty_days_ago).group_by(columns.date_applied)
 
-    daily_counts = db.session.query(
-        JobApplication.date_applied,
-        func.count(JobApplication.id)
-    ).filter(
-        JobApplication.date_applied >= thirty_days_ago
-    ).group_by(
-        JobApplication.date_applied
-    ).order_by(
-        JobApplication.date_applied
-    ).all()
+    if _read_engine().dialect.name == 'postgresql':
+        # Dense series built in SQL: every day in the window, zero when empty
+        days = func.generate_series(
+            cast(thirty_days_ago, DateTime), cast(today, DateTime), timedelta(days=1)
+        ).table_valued('day').render_derived()
+        counts = daily_counts.subquery()
+        day = cast(days.c.day, Date)
+        timeline = _read(
+            select(day, func.coalesce(counts.c.count, 0))
+            .select_from(days.outerjoin(counts, counts.c.day == day))
+            .order_by(day)
+        ).all()
+    else:
+        counts = dict(_read(daily_counts).all())
+        window = (thirty_days_ago + timedelta(days=n) for n in range((today - thirty_days_ago).days + 1))
+        timeline = [(day, counts.get(day, 0)) for day in window]
 
-    timeline = [
-        {'date': date.isoformat(), 'count': count}
-        for date, count in daily_counts
-    ]
-
-    return jsonify({'timeline': timeline})
+    return jsonify({'timeline': [{'date': day.isoformat(), 'count': count} for day, count in timeline]})
 
 
 @api_bp.route('/dashboard/funnel', methods=['GET'])
+@conditional_dashboard
+@cached_json('dash:funnel', 'DASHBOARD_CACHE_TTL')
 def get_application_funnel():
     """Get funnel data showing progression through stages."""
+    columns, weight = _application_counts_source()
+    application_counts = select(
+        _sum_where(true(), weight).label('total'),
+        _sum_where(columns.response_received.is_(True), weight).label('with_response'),
+        _sum_where(columns.status == 'offered', weight).label('offers'),
+    ).select_from(columns.status.table).subquery()
 
-    total = JobApplication.query.count()
-    with_response = JobApplication.query.filter_by(response_received=True).count()
-
-    # Count by highest interview stage reached
-    apps_with_interviews = db.session.query(
+    # Highest interview stage each application reached, aggregated in one pass
+    max_stages = select(
         InterviewStage.application_id,
         func.max(InterviewStage.stage_number).label('max_stage')
     ).group_by(InterviewStage.application_id).subquery()
+    stage_counts = select(*(
+        _sum_where(max_stages.c.max_stage >= min_stage, literal(1)).label(f'stage_{min_stage}')
+        for _, min_stage in FUNNEL_INTERVIEW_STAGES
+    )).subquery()
 
-    first_interview = db.session.query(func.count()).filter(
-        apps_with_interviews.c.max_stage >= 1
-    ).scalar() or 0
-
-    second_interview = db.session.query(func.count()).filter(
-        apps_with_interviews.c.max_stage >= 2
-    ).scalar() or 0
-
-    third_plus = db.session.query(func.count()).filter(
-        apps_with_interviews.c.max_stage >= 3
-    ).scalar() or 0
-
-    offers = JobApplication.query.filter_by(status='offered').count()
+    # Both single-row aggregates are cross-joined into one round-trip
+    counts = _read(
+        select(application_counts, stage_counts).select_from(application_counts.join(stage_counts, true()))
+    ).one()
 
     return jsonify({
         'funnel': [
-            {'stage': 'Applied', 'count': total},
-            {'stage': 'Response', 'count': with_response},
-            {'stage': '1st Interview', 'count': first_interview},
-            {'stage': '2nd Interview', 'count': second_interview},
-            {'stage': '3rd+ Interview', 'count': third_plus},
-            {'stage': 'Offer', 'count': offers},
+            {'stage': 'Applied', 'count': counts.total},
+            {'stage': 'Response', 'count': counts.with_response},
+            *(
+                {'stage': label, 'count': counts._mapping[f'stage_{min_stage}']}
+                for label, min_stage in FUNNEL_INTERVIEW_STAGES
+            ),
+            {'stage': 'Offer', 'count': counts.offers},
         ]
     })
@@ -1,8 +1,16 @@
 """API endpoints for email integration with Google OAuth."""
 
 import re
-from flask import request, jsonify, redirect, session, url_for
-from datetime import datetime, timezone
+import traceback
+from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
+from flask import request, jsonify, redirect, session, url_for, g
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import lazyload, load_only
+from datetime import date, datetime, timezone
 
 from app.api import api_bp
 
@@ -19,50 +27,123 @@ def safe_isoformat(dt):
     except Exception:
         return None
 from app.extensions import db
+from app.json_provider import stream_jsonify
 from app.models import EmailSettings, ParsedEmail, JobApplication, Contact
-from app.services.email_connector import GmailOAuthConnector
+from app.services.email_connector import GmailOAuthConnector, prefetch
 from app.services.email_parser import JobEmailParser
 from app.services.google_oauth import get_authorization_url, exchange_code_for_tokens
-from app.services.user_service import get_current_user_id
-
 
+# Compiled once at import; these run per application and per email during scans
+_WHITESPACE_RE = re.compile(r'\s+')
+# Trailing company suffixes in one pass. The optional groups run in the
+# reverse of the order the suffixes used to be stripped one by one (inc,
+# llc, ltd, corp, corporation, company), so stacked suffixes such as
+# "Company Inc" are still removed exactly as the sequential passes did.
+_COMPANY_SUFFIX_RE = re.compile(
+    r'(?:\s+company\s*)?'
+    r'(?:\s+corporation\s*)?'
+    r'(?:(?:,\s*|,?\s+)corp\.?\s*)?'
+    r'(?:(?:,\s*|,?\s+)ltd\.?\s*)?'
+    r'(?:(?:,\s*|,?\s+)llc\.?\s*)?'
+    r'(?:(?:,\s*|,?\s+)inc\.?\s*)?$',
+    re.IGNORECASE
+)
+# Every name the suffix regex can shorten ends in one of these (after stripping dots)
+_COMPANY_SUFFIX_TAILS = ('inc', 'llc', 'ltd', 'corp', 'corporation', 'company')
+# Capitalized phrases that tend to name the sending company
+_COMPANY_IN_TEXT_RES = (
+    re.compile(r'[Ff]rom:\s*([A-Z][A-Za-z0-9\s&\-\.\']+?)(?:\s+Careers|\s+Team|\s*<|$|\n)', re.MULTILINE),
+    re.compile(r'[Ss]incerely,?\s*\n([A-Z][A-Za-z0-9\s&\-\.\']+)\n', re.MULTILINE),
+    re.compile(r'--\s*\n([A-Z][A-Za-z0-9\s&\-\.\']+)\s*\n', re.MULTILINE),
+    re.compile(r'(\b[A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:Careers|Team|Hiring|Recruiting)', re.MULTILINE),
+)
+_DOMAIN_RE = re.compile(r'@([^.>]+)')
+_CONTACT_DOMAIN_RE = re.compile(r'@([^.]+)')
+# Mail providers and hiring platforms: a contact's domain there says nothing about the employer
+_CONTACT_SKIP_DOMAINS = frozenset({
+    'gmail', 'yahoo', 'hotmail', 'outlook', 'aol', 'icloud', 'mail',
+    'indeed', 'indeedemail', 'linkedin', 'greenhouse', 'lever',
+    'workday', 'myworkdayjobs', 'icims', 'smartrecruiters',
+    'jobvite', 'taleo', 'workable', 'workablemail', 'ashby',
+    'bamboohr', 'breezy', 'jazz', 'applytojob', 'zoho',
+    'noreply', 'no-reply', 'handshake', 'joinhandshake',
+})
+_SENDER_RE = re.compile(r'^"?([^"<]+?)"?\s*<')
+# Sender parsing: "Name <email>", a bare address, and punctuation ignored in names
+_NAME_EMAIL_RE = re.compile(r'^"?([^"<]+?)"?\s*<([^>]+)>')
+_EMAIL_ADDR_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_NAME_PUNCTUATION_TABLE = str.maketrans('', '', "().'-,")
+# Sender domains and names that identify a platform or mailbox rather than the employer
+_SKIP_DOMAINS = frozenset({
+    'indeed', 'linkedin', 'greenhouse', 'lever', 'gmail',
+    'outlook', 'yahoo', 'hotmail', 'icims', 'workday',
+    'myworkday', 'myworkdayjobs',
+    'smartrecruiters', 'jobvite', 'taleo', 'ashby', 'workable',
+    'bamboohr', 'breezy', 'jazz', 'zoho', 'noreply', 'mail',
+})
+_SKIP_SENDER_NAMES = frozenset({
+    'careers', 'jobs', 'recruiting', 'talent', 'hr', 'hiring',
+    'noreply', 'no-reply', 'notifications', 'team',
+})
+_PLATFORM_KEYWORDS = ('indeed', 'linkedin', 'greenhouse', 'lever', 'workday',
+                      'icims', 'smartrecruiters', 'workable', 'handshake')
+# Noreply/automated address patterns to exclude
+_AUTOMATED_SENDER_PATTERNS = (
+    'noreply', 'no-reply', 'donotreply', 'do-not-reply',
+    'notifications@', 'alerts@', 'updates@', 'info@',
+    'jobs@', 'careers@', 'recruiting@', 'talent@',
+    'applications@', 'apply@', 'hiring@', 'hr@',
+    'system@', 'automated@', 'mailer@', 'postmaster@',
+)
+# Platform domains that are always automated
+_PLATFORM_SENDER_DOMAINS = (
+    'indeed.com', 'indeedemail.com', 'linkedin.com', 'linkedin.email',
+    'greenhouse.io', 'greenhouse-mail.io', 'lever.co',
+    'icims.com', 'workday.com', 'myworkdayjobs.com',
+    'smartrecruiters.com', 'jobvite.com', 'taleo.net',
+    'workable.com', 'workablemail.com', 'ashbyhq.com',
+    'bamboohr.com', 'breezy.hr', 'jazz.co', 'applytojob.com',
+)
+# Every literal above in one alternation, so a sender is checked in a single scan
+_AUTOMATED_SENDER_RE = re.compile(
+    '|'.join(map(re.escape, _AUTOMATED_SENDER_PATTERNS + _PLATFORM_SENDER_DOMAINS))
+)
+# Words that indicate a sender name is NOT a person's name (checked as whole words)
+_NON_PERSON_WORDS = frozenset({
+    # Platform names
+    'indeed', 'linkedin', 'greenhouse', 'lever', 'workday', 'myworkday',
+    'myworkdayjobs', 'icims',
+    'handshake', 'glassdoor', 'ziprecruiter', 'monster', 'careerbuilder',
+    'smartrecruiters', 'jobvite', 'workable', 'ashby', 'bamboohr',
+    # Business/generic terms (only match as whole words)
+    'recruiting', 'recruitment', 'talent', 'careers', 'hiring',
+    'team', 'staff', 'department', 'dept',
+    'company', 'corp', 'corporation', 'inc', 'llc', 'ltd',
+    'solutions', 'services', 'consulting', 'associates', 'partners',
+    'mortgage', 'insurance', 'financial', 'technologies',
+    'healthcare', 'medical', 'logistics', 'enterprise',
+    'global', 'national', 'international', 'resources', 'capital',
+    # Automated senders
+    'notifications', 'noreply', 'no-reply', 'donotreply',
+    'support', 'admin', 'system', 'updates', 'alerts', 'info',
+    'jobs', 'hr', 'apply', 'applications',
+})
+# Statuses a detected rejection must not overwrite, and those an interview invite may advance
+_FINAL_STATUSES = frozenset({'offered', 'withdrawn'})
+_PRE_INTERVIEW_STATUSES = frozenset({'applied', 'follow_up'})
+# The parser keeps no per-call state, so one instance serves every request
+_PARSER = JobEmailParser()
+
+
+@lru_cache(maxsize=4096)
 def is_personal_email(from_address: str) -> bool:
     """
     Check if an email is from a personal sender (not a noreply/automated system).
     Returns True if it looks like a real person responded.
-    """
-    from_lower = from_address.lower()
-
-    # Noreply/automated patterns to exclude
-    automated_patterns = [
-        'noreply', 'no-reply', 'donotreply', 'do-not-reply',
-        'notifications@', 'alerts@', 'updates@', 'info@',
-        'jobs@', 'careers@', 'recruiting@', 'talent@',
-        'applications@', 'apply@', 'hiring@', 'hr@',
-        'system@', 'automated@', 'mailer@', 'postmaster@',
-    ]
-
-    # Platform domains that are always automated
-    platform_domains = [
-        'indeed.com', 'indeedemail.com', 'linkedin.com', 'linkedin.email',
-        'greenhouse.io', 'greenhouse-mail.io', 'lever.co',
-        'icims.com', 'workday.com', 'myworkdayjobs.com',
-        'smartrecruiters.com', 'jobvite.com', 'taleo.net',
-        'workable.com', 'workablemail.com', 'ashbyhq.com',
-        'bamboohr.com', 'breezy.hr', 'jazz.co', 'applytojob.com',
-    ]
 
-    # Check for automated patterns
-    for pattern in automated_patterns:
-        if pattern in from_lower:
-            return False
-
-    # Check for platform domains
-    for domain in platform_domains:
-        if domain in from_lower:
-            return False
-
-    return True
+    Memoized like _parse_sender: one sender's address recurs across a scan.
+    """
+    return _AUTOMATED_SENDER_RE.search(from_address.lower()) is None
 
 
 def has_personal_name(from_address: str) -> bool:
@@ -70,8 +151,15 @@ def has_personal_name(from_address: str) -> bool:
     Check if the From field contains a real person's name (first and last name required).
     Works even for platform emails like '"Kylie Morin" <hash@indeedemail.com>'.
     """
-    sender_info = extract_sender_info(from_address)
-    name = sender_info.get('name')
+    # A display name only exists in the "Name <email>" form; bare addresses skip parsing
+    if '<' not in from_address:
+        return False
+    return _is_person_name(_parse_sender(from_address)[0])
+
+
+@lru_cache(maxsize=4096)
+def _is_person_name(name: str) -> bool:
+    """The name checks behind has_personal_name, for an already-parsed sender name."""
     if not name:
         return False
 
@@ -84,28 +172,7 @@ def has_personal_name(from_address: str) -> bool:
     # Split name into individual words for word-level checks
     name_words = set(name_lower.split())
 
-    # Words that indicate this is NOT a person's name (checked as whole words)
-    non_person_words = {
-        # Platform names
-        'indeed', 'linkedin', 'greenhouse', 'lever', 'workday', 'myworkday',
-        'myworkdayjobs', 'icims',
-        'handshake', 'glassdoor', 'ziprecruiter', 'monster', 'careerbuilder',
-        'smartrecruiters', 'jobvite', 'workable', 'ashby', 'bamboohr',
-        # Business/generic terms (only match as whole words)
-        'recruiting', 'recruitment', 'talent', 'careers', 'hiring',
-        'team', 'staff', 'department', 'dept',
-        'company', 'corp', 'corporation', 'inc', 'llc', 'ltd',
-        'solutions', 'services', 'consulting', 'associates', 'partners',
-        'mortgage', 'insurance', 'financial', 'technologies',
-        'healthcare', 'medical', 'logistics', 'enterprise',
-        'global', 'national', 'international', 'resources', 'capital',
-        # Automated senders
-        'notifications', 'noreply', 'no-reply', 'donotreply',
-        'support', 'admin', 'system', 'updates', 'alerts', 'info',
-        'jobs', 'hr', 'apply', 'applications',
-    }
-
-    if name_words & non_person_words:
+    if name_words & _NON_PERSON_WORDS:
         return False
 
     # Require first and last name (at least 2 name parts)
@@ -114,51 +181,80 @@ def has_personal_name(from_address: str) -> bool:
         return False
 
     # Check name looks like a person (mostly alphabetic)
-    cleaned = re.sub(r'[().\'\-,]', '', name_lower)
-    alpha_ratio = sum(c.isalpha() or c.isspace() for c in cleaned) / max(len(cleaned), 1)
+    cleaned = name_lower.translate(_NAME_PUNCTUATION_TABLE)
+    # map() keeps the per-character tests in C; no character is both alpha and space
+    alpha_ratio = (sum(map(str.isalpha, cleaned)) + sum(map(str.isspace, cleaned))) / max(len(cleaned), 1)
     if alpha_ratio < 0.8:
         return False
 
     return True
 
 
+def classify_sender(from_address: str) -> dict:
+    """
+    Parse a From address once and answer every contact-scan question about it.
+
+    Returns:
+        dict: name and email as from extract_sender_info, plus
+        has_personal_name and is_personal as from the functions of those names.
+    """
+    name, email = _parse_sender(from_address)
+    return {
+        'name': name,
+        'email': email,
+        'has_personal_name': _is_person_name(name),
+        'is_personal': is_personal_email(from_address),
+    }
+
+
 def extract_sender_info(from_address: str) -> dict:
     """
     Extract sender name and email from a From address.
     Handles formats like: "John Smith <john@company.com>" or just "john@company.com"
     """
-    result = {'name': None, 'email': None}
+    name, email = _parse_sender(from_address)
+    return {'name': name, 'email': email}
 
+
+@lru_cache(maxsize=4096)
+def _parse_sender(from_address: str) -> tuple:
+    """
+    Memoized (name, email) behind extract_sender_info.
+
+    The same From addresses recur across a scan's emails and are parsed by
+    several helpers; extract_sender_info hands out a fresh dict each time,
+    so the cache can't be mutated through it.
+    """
     # Try to extract "Name <email>" format
-    match = re.match(r'^"?([^"<]+?)"?\s*<([^>]+)>', from_address)
+    match = _NAME_EMAIL_RE.match(from_address)
     if match:
         name = match.group(1).strip().strip('"\'')
         # Handle "Name | Company" format - extract just the name part
         if ' | ' in name:
             name = name.split(' | ')[0].strip()
-        result['name'] = name
-        result['email'] = match.group(2).strip()
-    else:
-        # Just an email address
-        email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', from_address)
-        if email_match:
-            result['email'] = email_match.group(0)
+        return name, match.group(2).strip()
 
-    return result
+    # Just an email address
+    email_match = _EMAIL_ADDR_RE.search(from_address)
+    return None, email_match.group(0) if email_match else None
 
 
+@lru_cache(maxsize=4096)
 def normalize_company_name(name: str) -> str:
-    """Normalize company name for comparison by removing suffixes and extra spaces."""
+    """
+    Normalize company name for comparison by removing suffixes and extra spaces.
+
+    Memoized: the same application and email company names recur across
+    every email of a scan and across scans.
+    """
     if not name:
         return ""
     # Remove common company suffixes
-    name = re.sub(r'\s+', ' ', name.strip())
-    name = re.sub(r',\s*inc\.?\s*$|,?\s+inc\.?\s*$', '', name, flags=re.IGNORECASE)
-    name = re.sub(r',\s*llc\.?\s*$|,?\s+llc\.?\s*$', '', name, flags=re.IGNORECASE)
-    name = re.sub(r',\s*ltd\.?\s*$|,?\s+ltd\.?\s*$', '', name, flags=re.IGNORECASE)
-    name = re.sub(r',\s*corp\.?\s*$|,?\s+corp\.?\s*$', '', name, flags=re.IGNORECASE)
-    name = re.sub(r'\s+corporation\s*$', '', name, flags=re.IGNORECASE)
-    name = re.sub(r'\s+company\s*$', '', name, flags=re.IGNORECASE)
+    name = _WHITESPACE_RE.sub(' ', name.strip())
+    # Most names carry no suffix; a plain endswith skips the regex for them
+    if not name.lower().rstrip('.').endswith(_COMPANY_SUFFIX_TAILS):
+        return name
+    name = _COMPANY_SUFFIX_RE.sub('', name, count=1)
     return name.strip()
 
 
@@ -168,22 +264,16 @@ def extract_companies_from_text(text: str) -> list:
         return []
     
     companies = []
+    seen = set()  # O(1) dedupe; the list keeps first-seen order
     # Find capitalized phrases (potential company names)
     # Look for "From: CompanyName" or patterns like that
-    patterns = [
-        r'[Ff]rom:\s*([A-Z][A-Za-z0-9\s&\-\.\']+?)(?:\s+Careers|\s+Team|\s*<|$|\n)',
-        r'[Ss]incerely,?\s*\n([A-Z][A-Za-z0-9\s&\-\.\']+)\n',
-        r'--\s*\n([A-Z][A-Za-z0-9\s&\-\.\']+)\s*\n',
-        r'(\b[A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:Careers|Team|Hiring|Recruiting)',
-    ]
-    
-    for pattern in patterns:
-        matches = re.finditer(pattern, text, re.MULTILINE)
-        for match in matches:
+    for pattern in _COMPANY_IN_TEXT_RES:
+        for match in pattern.finditer(text):
             company = match.group(1).strip()
-            if len(company) > 3 and len(company) < 80 and company not in companies:
+            if len(company) > 3 and len(company) < 80 and company not in seen:
+                seen.add(company)
                 companies.append(company)
-    
+
     return companies
 
 
@@ -232,8 +322,79 @@ def pick_best_match_for_rejection(applications: list, position: str) -> 'Optiona
     return scored[0][2]
 
 
-def find_matching_applications(company: str, position: str, email_from: str, body_preview: str, user_id: str = None) -> list:
-    """Find matching applications using multiple matching strategies."""
+class MatchCandidates:
+    """
+    The user's applications, prepared once for matching a whole batch of emails.
+
+    Each entry is an (application, normalized lowercase name, lowercase name)
+    tuple, so company names are normalized once per scan instead of once per
+    email. A trigram index over the lowercase names lets substring lookups
+    check only the applications that share every trigram of the needle.
+    """
+
+    def __init__(self, applications=()):
+        self.entries = []
+        self._trigrams = defaultdict(set)
+        for app in applications:
+            self.add(app)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def add(self, app: JobApplication):
+        """Add an application, e.g. one created mid-scan so later emails can match it."""
+        name_lower = (app.company_name or '').lower()
+        position = len(self.entries)
+        self.entries.append((app, normalize_company_name(app.company_name).lower(), name_lower))
+        for i in range(len(name_lower) - 2):
+            self._trigrams[name_lower[i:i + 3]].add(position)
+
+    def name_contains(self, needle: str) -> list:
+        """Applications whose company name contains needle, case-insensitively."""
+        needle = needle.lower()
+        if len(needle) < 3:
+            return [app for app, _, name_lower in self.entries if needle in name_lower]
+
+        postings = sorted(
+            (self._trigrams.get(needle[i:i + 3], ()) for i in range(len(needle) - 2)),
+            key=len
+        )
+        hits = set(postings[0]).intersection(*postings[1:])
+        # Sharing every trigram doesn't guarantee the substring, so verify;
+        # sorting keeps the results in load order
+        return [
+            self.entries[i][0] for i in sorted(hits)
+            if needle in self.entries[i][2]
+        ]
+
+
+def build_match_candidates(user_id: str = None) -> MatchCandidates:
+    """Load the user's applications once for a whole batch of emails."""
+    # Only the columns matching and status updates touch; large text columns
+    # such as job_description and notes stay in the database
+    query = JobApplication.query.options(
+        load_only(
+            JobApplication.company_name, JobApplication.position, JobApplication.status,
+            JobApplication.date_applied, JobApplication.response_date, JobApplication.response_received,
+        ),
+        lazyload(JobApplication.tags),
+    )
+    if user_id:
+        query = query.filter_by(user_id=user_id)
+    return MatchCandidates(query.all())
+
+
+def find_matching_applications(company: str, position: str, email_from: str, body_preview: str,
+                               user_id: str = None, candidates: MatchCandidates = None) -> list:
+    """
+    Find matching applications using multiple matching strategies.
+
+    Matching runs in memory over candidates from build_match_candidates();
+    callers handling many emails should build them once and pass them in.
+    """
+    if candidates is None:
+        candidates = build_match_candidates(user_id)
+
     # Treat placeholder value as no position — prevents "Unknown Position" being used
     # as a literal search string which would fail all position checks and fall through
     # to domain matching, returning every application at the same company.
@@ -248,29 +409,24 @@ def find_matching_applications(company: str, position: str, email_from: str, bod
     # text doesn't exactly match what's stored (e.g., "Ref: 91272 - Product Manager"
     # vs "Product Manager" stored in DB).
     if company:
-        normalized_company = normalize_company_name(company)
-        base_query = JobApplication.query
-        if user_id:
-            base_query = base_query.filter_by(user_id=user_id)
-        apps = base_query.all()
+        normalized_company = normalize_company_name(company).lower()
+        pos_lower = position.lower() if position else None
 
         company_pos_matches = []
         company_only_matches = []
 
-        for app in apps:
-            normalized_app_name = normalize_company_name(app.company_name)
+        for app, normalized_app_name, _ in candidates:
             # Require a meaningful name length to avoid substring false-positives
             # (e.g., "In" matching "LinkedIn", "A" matching "Apple")
             if len(normalized_app_name) < 3:
                 continue
             # Direct match or substring match (bidirectional)
             company_match = (
-                normalized_company.lower() in normalized_app_name.lower() or
-                normalized_app_name.lower() in normalized_company.lower()
+                normalized_company in normalized_app_name or
+                normalized_app_name in normalized_company
             )
             if company_match:
-                if position and app.position:
-                    pos_lower = position.lower()
+                if pos_lower and app.position:
                     app_pos_lower = app.position.lower()
                     # Bidirectional: either is a substring of the other
                     if pos_lower in app_pos_lower or app_pos_lower in pos_lower:
@@ -291,17 +447,10 @@ def find_matching_applications(company: str, position: str, email_from: str, bod
         normalized_company = normalize_company_name(company)
         words = [w for w in normalized_company.split() if len(w) > 3]
         for word in words:
-            query = JobApplication.query.filter(
-                JobApplication.company_name.ilike(f'%{word}%')
-            )
-            if user_id:
-                query = query.filter(JobApplication.user_id == user_id)
-            apps = query.all()
-            if apps:
-                applications.extend(apps)
-        
+            applications.extend(candidates.name_contains(word))
+
         if applications:
-            return list(set(applications))  # Remove duplicates
+            return list(dict.fromkeys(applications))  # Remove duplicates, keep order
 
     # Strategy 3: Try extracting company from email body_preview
     if body_preview and not applications:
@@ -309,60 +458,34 @@ def find_matching_applications(company: str, position: str, email_from: str, bod
         for potential_company in potential_companies:
             normalized = normalize_company_name(potential_company)
             if normalized:
-                query = JobApplication.query.filter(
-                    JobApplication.company_name.ilike(f'%{normalized}%')
-                )
-                if user_id:
-                    query = query.filter(JobApplication.user_id == user_id)
-                apps = query.all()
-                if apps:
-                    applications.extend(apps)
-        
+                applications.extend(candidates.name_contains(normalized))
+
         if applications:
-            return list(set(applications))
+            return list(dict.fromkeys(applications))
 
     # Strategy 4: Extract company from email domain
     if not applications:
-        domain_match = re.search(r'@([^.>]+)', email_from)
+        domain_match = _DOMAIN_RE.search(email_from)
         if domain_match:
             domain = domain_match.group(1).lower()
-            skip_domains = ['indeed', 'linkedin', 'greenhouse', 'lever', 'gmail',
-                           'outlook', 'yahoo', 'hotmail', 'icims', 'workday',
-                           'myworkday', 'myworkdayjobs',
-                           'smartrecruiters', 'jobvite', 'taleo', 'ashby', 'workable',
-                           'bamboohr', 'breezy', 'jazz', 'zoho', 'noreply', 'mail']
-            if domain not in skip_domains and len(domain) > 2:
-                query = JobApplication.query.filter(
-                    JobApplication.company_name.ilike(f'%{domain}%')
-                )
-                if user_id:
-                    query = query.filter(JobApplication.user_id == user_id)
-                apps = query.all()
+            if domain not in _SKIP_DOMAINS and len(domain) > 2:
+                apps = candidates.name_contains(domain)
                 if apps:
                     applications.extend(apps)
-                    return list(set(applications))
+                    return list(dict.fromkeys(applications))
 
     # Strategy 5: Try sender name
     if not applications:
-        sender_match = re.match(r'^"?([^"<]+?)"?\s*<', email_from)
+        sender_match = _SENDER_RE.match(email_from)
         if sender_match:
             sender_name = sender_match.group(1).strip().strip('"\'')
             if ' @ ' in sender_name:
                 sender_name = sender_name.split(' @ ')[0].strip()
-            
-            skip_names = ['careers', 'jobs', 'recruiting', 'talent', 'hr', 'hiring',
-                         'noreply', 'no-reply', 'notifications', 'team']
-            platform_keywords = ['indeed', 'linkedin', 'greenhouse', 'lever', 'workday',
-                                'icims', 'smartrecruiters', 'workable', 'handshake']
-            
-            if (sender_name.lower() not in skip_names and len(sender_name) > 2 and
-                not any(p in sender_name.lower() for p in platform_keywords)):
-                query = JobApplication.query.filter(
-                    JobApplication.company_name.ilike(f'%{sender_name}%')
-                )
-                if user_id:
-                    query = query.filter(JobApplication.user_id == user_id)
-                apps = query.all()
+
+            sender_lower = sender_name.lower()
+            if (sender_lower not in _SKIP_SENDER_NAMES and len(sender_name) > 2 and
+                not any(p in sender_lower for p in _PLATFORM_KEYWORDS)):
+                apps = candidates.name_contains(sender_name)
                 if apps:
                     applications.extend(apps)
 
@@ -370,22 +493,78 @@ def find_matching_applications(company: str, position: str, email_from: str, bod
                 if not apps and ' ' in sender_name:
                     first_word = sender_name.split()[0]
                     if len(first_word) > 3:
-                        query = JobApplication.query.filter(
-                            JobApplication.company_name.ilike(f'%{first_word}%')
-                        )
-                        if user_id:
-                            query = query.filter(JobApplication.user_id == user_id)
-                        apps = query.all()
-                        if apps:
-                            applications.extend(apps)
-    
-    return list(set(applications))  # Remove duplicates
+                        applications.extend(candidates.name_contains(first_word))
+
+    return list(dict.fromkeys(applications))  # Remove duplicates, keep order
+
+
+def existing_contact_names(user_id: str, names) -> set:
+    """
+    Return the lowercased names among names that the user already has contacts for.
+
+    Answers a whole batch of "does this contact exist?" checks with one query.
+    """
+    lowered = {name.lower() for name in names}
+    if not lowered:
+        return set()
+    return set(db.session.scalars(
+        select(func.lower(Contact.name)).where(
+            Contact.user_id == user_id,
+            func.lower(Contact.name).in_(lowered)
+        )
+    ))
+
+
+def existing_contact_ids(user_id: str, names) -> dict:
+    """
+    Map the lowercased names among names to the id of the user's contact by that name.
+
+    Like existing_contact_names, for callers that report which contact matched.
+    """
+    lowered = {name.lower() for name in names}
+    if not lowered:
+        return {}
+    name_key = func.lower(Contact.name)
+    return dict(db.session.execute(
+        select(name_key, func.min(Contact.id)).where(
+            Contact.user_id == user_id,
+            name_key.in_(lowered)
+        ).group_by(name_key)
+    ).all())
+
+
+def _insert_skipping_duplicates(table):
+    """INSERT into table that skips rows conflicting with a unique constraint."""
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        return pg_insert(table).on_conflict_do_nothing()
+    if dialect == 'sqlite':
+        return sqlite_insert(table).on_conflict_do_nothing()
+    return insert(table)
+
+
+def _stream_unique(emails, received: list):
+    """
+    Yield emails whose message_id hasn't been seen yet, appending each to received.
+
+    Feeds the parser straight from the connector while keeping the raw emails
+    for the response's counts.
+    """
+    seen_ids = set()
+    for em in emails:
+        mid = em.get('message_id')
+        if mid and mid in seen_ids:
+            continue
+        if mid:
+            seen_ids.add(mid)
+        received.append(em)
+        yield em
 
 
 @api_bp.route('/email/settings', methods=['GET'])
 def get_email_settings():
     """Get current email settings for logged-in user."""
-    user_id = get_current_user_id()
+    user_id = g.user_id
     if not user_id:
         return jsonify({'configured': False, 'logged_in': False})
 
@@ -409,7 +588,7 @@ def start_oauth():
 @api_bp.route('/email/settings', methods=['DELETE'])
 def delete_email_settings():
     """Delete email settings (disconnect Gmail) for current user."""
-    user_id = get_current_user_id()
+    user_id = g.user_id
     settings = EmailSettings.query.filter_by(user_id=user_id).first()
     if settings:
         db.session.delete(settings)
@@ -420,7 +599,7 @@ def delete_email_settings():
 @api_bp.route('/email/sync', methods=['POST'])
 def sync_emails():
     """Sync emails and parse job applications."""
-    user_id = get_current_user_id()
+    user_id = g.user_id
     if not user_id:
         return jsonify({'error': 'Please sign in first.'}), 401
 
@@ -437,7 +616,11 @@ def sync_emails():
             settings.token_expiry
         )
         with connector:
-            raw_emails = connector.fetch_job_emails(days_back=days_back, limit=100)
+            # Parse emails as they arrive while the rest are still downloading
+            raw_emails = []
+            parsed_emails = _PARSER.parse_multiple(_stream_unique(
+                prefetch(connector.iter_job_emails(days_back=days_back, limit=100)), raw_emails
+            ))
 
             # Update tokens if refreshed
             updated_tokens = connector.get_updated_tokens()
@@ -445,10 +628,6 @@ def sync_emails():
                 settings.access_token = updated_tokens['access_token']
                 settings.token_expiry = updated_tokens['token_expiry']
 
-        # Parse emails
-        parser = JobEmailParser()
-        parsed_emails = parser.parse_multiple(raw_emails)
-
         # Debug info - find Indeed emails (not Indeed Apply) and show their body
         debug_emails = []
         for email in raw_emails:
@@ -466,48 +645,66 @@ def sync_emails():
                 if len(debug_emails) >= 3:
                     break
 
-        # Save to database (skip duplicates and already-imported applications)
-        new_count = 0
+        # Save to database (skip duplicates and already-imported applications).
+        # Both checks are answered from two up-front queries rather than per email.
+        existing_ids = set(db.session.scalars(
+            select(ParsedEmail.message_id).where(
+                ParsedEmail.message_id.in_({str(p['message_id']) for p in parsed_emails})
+            )
+        ))
+        existing_apps = [
+            ((company_name or '').lower(), (app_position or '').lower())
+            for company_name, app_position in db.session.execute(
+                select(JobApplication.company_name, JobApplication.position)
+                .where(JobApplication.user_id == user_id)
+            )
+        ]
+
+        records = []
         skipped_imported = 0
         for parsed in parsed_emails:
             msg_id = str(parsed['message_id'])
             # Skip if we've already parsed this exact message
-            existing = ParsedEmail.query.filter_by(message_id=msg_id).first()
-            if existing:
+            if msg_id in existing_ids:
                 continue
 
             # If an application already exists that matches the parsed company/position,
             # skip creating a parsed email to avoid re-importing.
-            company = (parsed.get('company_name') or '').strip()
-            position = (parsed.get('position') or '').strip()
-            app_exists = None
-            if company or position:
-                app_q = JobApplication.query.filter_by(user_id=user_id)
-                if company:
-                    app_q = app_q.filter(JobApplication.company_name.ilike(f'%{company}%'))
-                if position:
-                    app_q = app_q.filter(JobApplication.position.ilike(f'%{position}%'))
-                app_exists = app_q.first()
+            company = (parsed.get('company_name') or '').strip().lower()
+            position = (parsed.get('position') or '').strip().lower()
+            app_exists = (company or position) and any(
+                company in app_company and position in app_position
+                for app_company, app_position in existing_apps
+            )
 
             if app_exists:
                 skipped_imported += 1
                 continue
 
-            email_record = ParsedEmail(
-                user_id=user_id,
-                message_id=msg_id,
-                email_subject=parsed['email_subject'],
-                email_from=parsed['email_from'],
-                email_date=parsed['email_date'],
-                body_preview=parsed.get('body_preview', ''),
-                company_name=parsed['company_name'],
-                position=parsed['position'],
-                platform=parsed['platform'],
-                confidence=parsed['confidence'],
-                status='pending'
-            )
-            db.session.add(email_record)
-            new_count += 1
+            records.append({
+                'user_id': user_id,
+                'message_id': msg_id,
+                'email_subject': parsed['email_subject'],
+                'email_from': parsed['email_from'],
+                'email_date': parsed['email_date'],
+                'body_preview': parsed.get('body_preview', ''),
+                'company_name': parsed['company_name'],
+                'position': parsed['position'],
+                'platform': parsed['platform'],
+                'confidence': parsed['confidence'],
+                'status': 'pending',
+            })
+            existing_ids.add(msg_id)
+
+        # One batched INSERT for every new email instead of a flush per object.
+        # A concurrent sync may have stored some of them since the check above;
+        # the unique message_id makes the database skip those rows.
+        # Inserting into the Table rather than the mapped class keeps this a
+        # Core executemany, whose rowcount counts only the rows inserted.
+        new_count = 0
+        if records:
+            result = db.session.execute(_insert_skipping_duplicates(ParsedEmail.__table__), records)
+            new_count = result.rowcount
 
         # Update last sync time
         settings.last_sync = datetime.utcnow()
@@ -529,7 +726,7 @@ def sync_emails():
 @api_bp.route('/email/parsed', methods=['GET'])
 def get_parsed_emails():
     """Get list of parsed emails for current user."""
-    user_id = get_current_user_id()
+    user_id = g.user_id
     status = request.args.get('status', 'pending')
 
     query = ParsedEmail.query.filter_by(user_id=user_id)
@@ -538,17 +735,19 @@ def get_parsed_emails():
 
     emails = query.order_by(ParsedEmail.email_date.desc()).all()
 
-    return jsonify({
-        'emails': [e.to_dict() for e in emails]
-    })
+    # status=all returns every email ever parsed; encode them one at a time.
+    # to_dict() reads only loaded columns, so it is safe after the session closes.
+    return stream_jsonify({
+        'emails': (e.to_dict() for e in emails)
+    }, 'emails')
 
 
 @api_bp.route('/email/parsed/clear', methods=['DELETE'])
 def clear_parsed_emails():
     """Clear all parsed emails for current user to allow re-sync."""
-    user_id = get_current_user_id()
-    count = ParsedEmail.query.filter_by(user_id=user_id).count()
-    ParsedEmail.query.filter_by(user_id=user_id).delete()
+    user_id = g.user_id
+    result = db.session.execute(delete(ParsedEmail).where(ParsedEmail.user_id == user_id))
+    count = result.rowcount
     db.session.commit()
     return jsonify({'message': f'Cleared {count} parsed emails', 'deleted': count})
 
@@ -556,7 +755,7 @@ def clear_parsed_emails():
 @api_bp.route('/email/parsed/<int:id>/import', methods=['POST'])
 def import_parsed_email(id):
     """Import a parsed email as a job application."""
-    user_id = get_current_user_id()
+    user_id = g.user_id
     parsed = ParsedEmail.query.filter_by(id=id, user_id=user_id).first_or_404()
 
     if parsed.status == 'imported':
@@ -591,7 +790,7 @@ def import_parsed_email(id):
 @api_bp.route('/email/parsed/<int:id>/ignore', methods=['POST'])
 def ignore_parsed_email(id):
     """Mark a parsed email as ignored."""
-    user_id = get_current_user_id()
+    user_id = g.user_id
     parsed = ParsedEmail.query.filter_by(id=id, user_id=user_id).first_or_404()
     parsed.status = 'ignored'
     db.session.commit()
@@ -602,7 +801,7 @@ def ignore_parsed_email(id):
 @api_bp.route('/email/parsed/<int:id>', methods=['DELETE'])
 def delete_parsed_email(id):
     """Delete a parsed email."""
-    user_id = get_current_user_id()
+    user_id = g.user_id
     parsed = ParsedEmail.query.filter_by(id=id, user_id=user_id).first_or_404()
     db.session.delete(parsed)
     db.session.commit()
@@ -613,24 +812,31 @@ def delete_parsed_email(id):
 @api_bp.route('/email/import-all', methods=['POST'])
 def import_all_pending():
     """Import all pending parsed emails as job applications."""
-    user_id = get_current_user_id()
-    pending = ParsedEmail.query.filter_by(user_id=user_id, status='pending').all()
-
-    imported = 0
-    for parsed in pending:
-        if parsed.company_name and parsed.confidence >= 0.5:
-            application = JobApplication(
-                user_id=user_id,
-                company_name=parsed.company_name,
-                position=parsed.position or 'Unknown Position',
-                date_applied=parsed.email_date.date() if parsed.email_date else None,
-                source='email',
-                notes="Imported from email"
-            )
-            db.session.add(application)
-            parsed.status = 'imported'
-            parsed.application_id = application.id
-            imported += 1
+    user_id = g.user_id
+    pending = [
+        parsed for parsed in ParsedEmail.query.filter_by(user_id=user_id, status='pending')
+        if parsed.company_name and parsed.confidence >= 0.5
+    ]
+
+    imported = len(pending)
+    if pending:
+        # Insert every application in one batched statement; RETURNING hands
+        # back the new ids in parameter order so each email can be linked
+        application_ids = db.session.scalars(
+            insert(JobApplication).returning(JobApplication.id, sort_by_parameter_order=True),
+            [{
+                'user_id': user_id,
+                'company_name': parsed.company_name,
+                'position': parsed.position or 'Unknown Position',
+                'date_applied': parsed.email_date.date() if parsed.email_date else date.today(),
+                'source': 'email',
+                'notes': 'Imported from email',
+            } for parsed in pending]
+        ).all()
+        db.session.execute(update(ParsedEmail), [
+            {'id': parsed.id, 'status': 'imported', 'application_id': application_id}
+            for parsed, application_id in zip(pending, application_ids)
+        ])
 
     db.session.commit()
 
@@ -643,7 +849,7 @@ def import_all_pending():
 @api_bp.route('/email/scan-responses', methods=['POST'])
 def scan_response_emails():
     """Scan emails for responses (rejections, interview requests, offers) and update application statuses."""
-    user_id = get_current_user_id()
+    user_id = g.user_id
     if not user_id:
         return jsonify({'error': 'Please sign in first.'}), 401
 
@@ -660,21 +866,15 @@ def scan_response_emails():
             settings.token_expiry
         )
         with connector:
-            # Fetch from both sources and merge — fetch_job_emails catches platform ATS,
-            # fetch_response_emails catches rejection/offer language from any sender.
-            job_emails = connector.fetch_job_emails(days_back=days_back, limit=75)
-            response_specific = connector.fetch_response_emails(days_back=days_back, limit=150)
-
-            # Deduplicate by message_id
-            seen_ids = set()
+            # Fetch from both sources and merge — iter_job_emails catches platform ATS,
+            # iter_response_emails catches rejection/offer language from any sender.
+            # Emails are parsed for responses as they arrive, deduplicated by message_id.
             raw_emails = []
-            for em in job_emails + response_specific:
-                mid = em.get('message_id')
-                if mid and mid in seen_ids:
-                    continue
-                if mid:
-                    seen_ids.add(mid)
-                raw_emails.append(em)
+            fetched = chain(
+                connector.iter_job_emails(days_back=days_back, limit=75),
+                connector.iter_response_emails(days_back=days_back, limit=150),
+            )
+            response_emails = _PARSER.parse_response_emails(_stream_unique(prefetch(fetched), raw_emails))
 
             # Update tokens if refreshed
             updated_tokens = connector.get_updated_tokens()
@@ -682,9 +882,8 @@ def scan_response_emails():
                 settings.access_token = updated_tokens['access_token']
                 settings.token_expiry = updated_tokens['token_expiry']
 
-        # Parse emails for responses
-        parser = JobEmailParser()
-        response_emails = parser.parse_response_emails(raw_emails)
+        # Load the user's applications once; every email is matched against them in memory
+        candidates = build_match_candidates(user_id)
 
         # Try to match responses to existing applications and update status
         updates = []
@@ -712,7 +911,7 @@ def scan_response_emails():
                 continue
 
             # Find matching application(s) using improved matching logic
-            applications = find_matching_applications(company, position, from_addr, body_preview, user_id)
+            applications = find_matching_applications(company, position, from_addr, body_preview, user_id, candidates)
 
             # For rejections with multiple company matches, narrow to the single best
             # position match. This prevents one IBM rejection email from marking every
@@ -723,13 +922,11 @@ def scan_response_emails():
                 applications = [best] if best else []
 
             # Check if any matched app already has this response (already scanned)
-            already_scanned = False
-            for app in applications:
-                if (app.response_date and email_date and
-                    app.response_date == email_date.date() and
-                    app.status == response_type):
-                    already_scanned = True
-                    break
+            email_day = email_date.date() if email_date else None
+            already_scanned = email_day is not None and any(
+                app.response_date == email_day and app.status == response_type
+                for app in applications
+            )
 
             # Skip emails that have already been scanned and processed
             if already_scanned:
@@ -750,26 +947,29 @@ def scan_response_emails():
 
                 # Only create if we haven't created one with this company+position combo
                 if app_key not in created_app_keys:
-                    # Also check if it already exists in the database
-                    existing = JobApplication.query.filter(
-                        JobApplication.user_id == user_id,
-                        JobApplication.company_name.ilike(f'%{normalize_company_name(company)}%'),
-                        JobApplication.position.ilike(f'%{position}%')
-                    ).first()
-
-                    if not existing:
+                    # Also check if it already exists in the database (only the id is needed)
+                    existing_id = db.session.scalar(
+                        select(JobApplication.id).where(
+                            JobApplication.user_id == user_id,
+                            JobApplication.company_name.ilike(f'%{normalize_company_name(company)}%'),
+                            JobApplication.position.ilike(f'%{position}%')
+                        ).limit(1)
+                    )
+
+                    if existing_id is None:
                         new_app = JobApplication(
                             user_id=user_id,
                             company_name=company,
                             position=position,
-                            date_applied=email_date.date() if email_date else datetime.utcnow().date(),
+                            date_applied=email_day or datetime.utcnow().date(),
                             source='email',
                             status=response_type,
                             response_received=True,
-                            response_date=email_date.date() if email_date else None,
+                            response_date=email_day,
                             notes="Imported from email"
                         )
                         db.session.add(new_app)
+                        candidates.add(new_app)
                         applications = [new_app]
                         newly_created = True
                         created_app_keys.add(app_key)
@@ -789,22 +989,18 @@ def scan_response_emails():
                     continue
                 
                 # Only update if the response is newer than the application
-                if email_date and app.date_applied and email_date.date() < app.date_applied:
+                if email_day and app.date_applied and email_day < app.date_applied:
                     continue
 
                 # Don't downgrade status (e.g., don't mark offered as rejected)
-                status_priority = {'applied': 0, 'follow_up': 1, 'interviewing': 2, 'offered': 3, 'rejected': 4, 'withdrawn': 5}
-                current_priority = status_priority.get(app.status, 0)
-                new_priority = status_priority.get(response_type, 0)
-
                 # Allow status update if it's a progression or rejection
                 should_update = False
                 if response_type == 'rejected':
                     # Only reject if not already offered or withdrawn
-                    should_update = app.status not in ['offered', 'withdrawn']
+                    should_update = app.status not in _FINAL_STATUSES
                 elif response_type == 'interviewing':
                     # Only update to interviewing if currently applied or follow_up
-                    should_update = app.status in ['applied', 'follow_up']
+                    should_update = app.status in _PRE_INTERVIEW_STATUSES
                 elif response_type == 'offered':
                     # Always update to offered (unless withdrawn)
                     should_update = app.status != 'withdrawn'
@@ -813,8 +1009,8 @@ def scan_response_emails():
                     old_status = app.status
                     app.status = response_type
                     app.response_received = True
-                    if email_date:
-                        app.response_date = email_date.date()
+                    if email_day:
+                        app.response_date = email_day
 
                     updates.append({
                         'application_id': app.id,
@@ -826,53 +1022,55 @@ def scan_response_emails():
                     })
 
         # Auto-save contacts from emails with personal sender names
-        contacts_created = 0
+        senders = []
         for response in response_emails:
+            sender = classify_sender(response.get('email_from', ''))
+            if sender['has_personal_name']:
+                senders.append((response, sender))
+        # One lookup for every name already saved; names saved below join the set
+        known_names = existing_contact_names(user_id, (sender['name'] for _, sender in senders))
+
+        contact_rows = []
+        for response, sender in senders:
             from_addr = response.get('email_from', '')
-            if not has_personal_name(from_addr):
-                continue
-
-            sender_info = extract_sender_info(from_addr)
-            if not sender_info.get('name'):
-                continue
 
             # Only save real email addresses, not platform relay addresses
-            contact_email = sender_info.get('email')
-            if contact_email and not is_personal_email(from_addr):
+            contact_email = sender['email']
+            if contact_email and not sender['is_personal']:
                 contact_email = None  # Don't save platform relay emails
 
             # Skip if contact with same name already exists for this user
-            existing_contact = Contact.query.filter(
-                Contact.user_id == user_id,
-                Contact.name.ilike(sender_info['name'])
-            ).first()
-            if existing_contact:
+            name_key = sender['name'].lower()
+            if name_key in known_names:
                 continue
+            known_names.add(name_key)
 
             # Find matching application for this contact
             company = response.get('company_name') or ''
             position = response.get('position') or ''
             body_preview = response.get('body_preview', '')
-            matched_apps = find_matching_applications(company, position, from_addr, body_preview, user_id)
+            matched_apps = find_matching_applications(company, position, from_addr, body_preview, user_id, candidates)
             app_id = matched_apps[0].id if matched_apps else None
             app_company = matched_apps[0].company_name if matched_apps else company
 
             email_date = response.get('email_date')
             last_contact = email_date.date() if email_date else None
 
-            contact = Contact(
-                user_id=user_id,
-                name=sender_info['name'],
-                email=contact_email,
-                company=app_company or None,
-                application_id=app_id,
-                email_subject=response.get('email_subject', '')[:500] or None,
-                source='email_scan',
-                last_contact_date=last_contact
-            )
-            db.session.add(contact)
-            contacts_created += 1
+            contact_rows.append({
+                'user_id': user_id,
+                'name': sender['name'],
+                'email': contact_email,
+                'company': app_company or None,
+                'application_id': app_id,
+                'email_subject': response.get('email_subject', '')[:500] or None,
+                'source': 'email_scan',
+                'last_contact_date': last_contact,
+            })
 
+        # New contacts go in as one batched INSERT rather than a flush per object
+        if contact_rows:
+            db.session.execute(insert(Contact), contact_rows)
+        contacts_created = len(contact_rows)
         db.session.commit()
 
         return jsonify({
@@ -884,7 +1082,6 @@ def scan_response_emails():
         })
 
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'error': f'Scan failed: {str(e)}'}), 500
 
@@ -892,7 +1089,7 @@ def scan_response_emails():
 @api_bp.route('/email/response-preview', methods=['POST'])
 def preview_response_emails():
     """Preview what response emails were found without updating anything."""
-    user_id = get_current_user_id()
+    user_id = g.user_id
     if not user_id:
         return jsonify({'error': 'Please sign in first.'}), 401
 
@@ -932,8 +1129,14 @@ def preview_response_emails():
                 db.session.commit()
 
         # Parse emails for responses
-        parser = JobEmailParser()
-        response_emails = parser.parse_response_emails(raw_emails)
+        response_emails = _PARSER.parse_response_emails(raw_emails)
+
+        candidates = build_match_candidates(user_id)
+        # Contacts already saved for any personal sender, looked up in one query
+        contact_ids = existing_contact_ids(user_id, (
+            _parse_sender(from_addr)[0] for from_addr in {r.get('email_from', '') for r in response_emails}
+            if has_personal_name(from_addr)
+        ))
 
         # Format for preview
         preview = []
@@ -953,16 +1156,14 @@ def preview_response_emails():
                 continue
 
             # Find potential matching applications using improved logic
-            apps = find_matching_applications(company, position, from_addr, body_preview, user_id)
+            apps = find_matching_applications(company, position, from_addr, body_preview, user_id, candidates)
 
             # Check if any matched app already has this response (already scanned)
-            already_scanned = False
-            for app in apps:
-                if (app.response_date and email_date and 
-                    app.response_date == email_date.date() and 
-                    app.status == response_type):
-                    already_scanned = True
-                    break
+            email_day = email_date.date() if email_date else None
+            already_scanned = email_day is not None and any(
+                app.response_date == email_day and app.status == response_type
+                for app in apps
+            )
             
             # Skip emails that have already been scanned and processed
             if already_scanned:
@@ -988,12 +1189,9 @@ def preview_response_emails():
             sender_info = extract_sender_info(from_addr) if is_personal else None
 
             # Check if we already have this contact
-            existing_contact = None
+            existing_contact_id = None
             if sender_info and sender_info.get('name'):
-                existing_contact = Contact.query.filter(
-                    Contact.user_id == user_id,
-                    Contact.name.ilike(sender_info['name'])
-                ).first()
+                existing_contact_id = contact_ids.get(sender_info['name'].lower())
 
             preview.append({
                 'email_subject': response.get('email_subject', '')[:100],
@@ -1007,7 +1205,7 @@ def preview_response_emails():
                 'would_be_duplicate': would_be_duplicate,
                 'is_personal_email': is_personal,
                 'sender_info': sender_info,
-                'existing_contact_id': existing_contact.id if existing_contact else None
+                'existing_contact_id': existing_contact_id
             })
 
         return jsonify({
@@ -1016,7 +1214,6 @@ def preview_response_emails():
         })
 
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'error': f'Preview failed: {str(e)}'}), 500
 
@@ -1024,7 +1221,7 @@ def preview_response_emails():
 @api_bp.route('/email/scan-contacts', methods=['POST'])
 def scan_contacts_from_emails():
     """Scan ALL fetched emails for personal sender info and save as contacts."""
-    user_id = get_current_user_id()
+    user_id = g.user_id
     if not user_id:
         return jsonify({'error': 'Please sign in first.'}), 401
 
@@ -1060,60 +1257,53 @@ def scan_contacts_from_emails():
                 settings.access_token = updated_tokens['access_token']
                 settings.token_expiry = updated_tokens['token_expiry']
 
-        contacts_created = 0
-        skipped_existing = 0
+        senders = []
         seen_names = set()  # Avoid processing duplicate senders in this batch
-
         for email in raw_emails:
-            from_addr = email.get('from_address', '')
-            if not has_personal_name(from_addr):
-                continue
-
-            sender_info = extract_sender_info(from_addr)
-            if not sender_info.get('name'):
+            sender = classify_sender(email.get('from_address', ''))
+            if not sender['has_personal_name']:
                 continue
 
-            name = sender_info['name']
-
             # Skip duplicates within this batch
-            name_key = name.lower().strip()
+            name_key = sender['name'].lower().strip()
             if name_key in seen_names:
                 continue
             seen_names.add(name_key)
+            senders.append((email, sender))
+        # One lookup for every sender name the user already has a contact for
+        known_names = existing_contact_names(user_id, (sender['name'] for _, sender in senders))
+
+        contact_rows = []
+        skipped_existing = 0
+        candidates = build_match_candidates(user_id)
+
+        for email, sender in senders:
+            from_addr = email.get('from_address', '')
+            name = sender['name']
 
             # Only save real email addresses, not platform relay addresses
-            contact_email = sender_info.get('email')
-            if contact_email and not is_personal_email(from_addr):
+            contact_email = sender['email']
+            if contact_email and not sender['is_personal']:
                 contact_email = None
 
             # Skip if contact with same name already exists
-            existing_contact = Contact.query.filter(
-                Contact.user_id == user_id,
-                Contact.name.ilike(name)
-            ).first()
-            if existing_contact:
+            if name.lower() in known_names:
                 skipped_existing += 1
                 continue
 
             # Try to match to an application using email domain or sender info
             subject = email.get('subject', '')
             body = email.get('body_text', '')[:500]
-            matched_apps = find_matching_applications('', '', from_addr, body, user_id)
+            matched_apps = find_matching_applications('', '', from_addr, body, user_id, candidates)
             app_id = matched_apps[0].id if matched_apps else None
             app_company = matched_apps[0].company_name if matched_apps else None
 
             # Extract company from email domain if no app match
             if not app_company and contact_email:
-                domain_match = re.search(r'@([^.]+)', contact_email)
+                domain_match = _CONTACT_DOMAIN_RE.search(contact_email)
                 if domain_match:
                     domain = domain_match.group(1)
-                    skip_domains = ['gmail', 'yahoo', 'hotmail', 'outlook', 'aol', 'icloud', 'mail',
-                                    'indeed', 'indeedemail', 'linkedin', 'greenhouse', 'lever',
-                                    'workday', 'myworkdayjobs', 'icims', 'smartrecruiters',
-                                    'jobvite', 'taleo', 'workable', 'workablemail', 'ashby',
-                                    'bamboohr', 'breezy', 'jazz', 'applytojob', 'zoho',
-                                    'noreply', 'no-reply', 'handshake', 'joinhandshake']
-                    if domain.lower() not in skip_domains:
+                    if domain.lower() not in _CONTACT_SKIP_DOMAINS:
                         app_company = domain.capitalize()
 
             email_date = email.get('date')
@@ -1131,19 +1321,20 @@ def scan_contacts_from_emails():
                 except (ValueError, AttributeError, TypeError):
                     pass
 
-            contact = Contact(
-                user_id=user_id,
-                name=name,
-                email=contact_email,
-                company=app_company or None,
-                application_id=app_id,
-                email_subject=subject[:500] if subject else None,
-                source='email_scan',
-                last_contact_date=last_contact
-            )
-            db.session.add(contact)
-            contacts_created += 1
+            contact_rows.append({
+                'user_id': user_id,
+                'name': name,
+                'email': contact_email,
+                'company': app_company or None,
+                'application_id': app_id,
+                'email_subject': subject[:500] if subject else None,
+                'source': 'email_scan',
+                'last_contact_date': last_contact,
+            })
 
+        if contact_rows:
+            db.session.execute(insert(Contact), contact_rows)
+        contacts_created = len(contact_rows)
         db.session.commit()
 
         return jsonify({
@@ -1156,7 +1347,6 @@ def scan_contacts_from_emails():
         })
 
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'error': f'Contact scan failed: {str(e)}'}), 500
 
@@ -1164,7 +1354,7 @@ def scan_contacts_from_emails():
 @api_bp.route('/email/save-connection', methods=['POST'])
 def save_connection_from_email():
     """Save a connection from a scanned email response."""
-    user_id = get_current_user_id()
+    user_id = g.user_id
     data = request.get_json() or {}
 
     name = data.get('name')
@@ -1179,12 +1369,11 @@ def save_connection_from_email():
 
     # Check if contact already exists with this email for this user
     if email:
-        existing = Contact.query.filter(
-            Contact.user_id == user_id,
-            Contact.email.ilike(email)
-        ).first()
-        if existing:
-            return jsonify({'error': 'Contact with this email already exists', 'contact_id': existing.id}), 409
+        existing_id = db.session.scalar(
+            select(Contact.id).where(Contact.user_id == user_id, Contact.email.ilike(email)).limit(1)
+        )
+        if existing_id is not None:
+            return jsonify({'error': 'Contact with this email already exists', 'contact_id': existing_id}), 409
 
     # Parse email date
     last_contact = None
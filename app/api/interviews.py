@@ -1,19 +1,26 @@
 """API endpoints for interview stages."""
 
-from flask import request, jsonify
+from flask import request, jsonify, abort
 from marshmallow import ValidationError
+from sqlalchemy import select
 
 from app.api import api_bp
 from app.extensions import db
 from app.models import JobApplication, InterviewStage
 from app.schemas.interview import InterviewCreateSchema, InterviewUpdateSchema
 
+_CREATE_SCHEMA = InterviewCreateSchema()
+_UPDATE_SCHEMA = InterviewUpdateSchema()
+
 
 @api_bp.route('/applications/<int:app_id>/interviews', methods=['GET'])
 def list_interviews(app_id):
     """List all interviews for an application."""
-    application = JobApplication.query.get_or_404(app_id)
-    interviews = application.interviews.order_by(InterviewStage.stage_number).all()
+    # The (application_id, stage_number) index serves this directly; the
+    # application itself is only looked up to tell "none yet" from a 404
+    interviews = InterviewStage.query.filter_by(application_id=app_id).order_by(InterviewStage.stage_number).all()
+    if not interviews and db.session.scalar(select(JobApplication.id).where(JobApplication.id == app_id)) is None:
+        abort(404)
 
     return jsonify({
         'interviews': [interview.to_dict() for interview in interviews]
@@ -24,10 +31,9 @@ def list_interviews(app_id):
 def create_interview(app_id):
     """Add a new interview stage to an application."""
     application = JobApplication.query.get_or_404(app_id)
-    schema = InterviewCreateSchema()
 
     try:
-        data = schema.load(request.json)
+        data = _CREATE_SCHEMA.load(request.json)
     except ValidationError as err:
         return jsonify({'errors': err.messages}), 400
 
@@ -56,10 +62,9 @@ def get_interview(id):
 def update_interview(id):
     """Update an interview stage."""
     interview = InterviewStage.query.get_or_404(id)
-    schema = InterviewUpdateSchema()
 
     try:
-        data = schema.load(request.json)
+        data = _UPDATE_SCHEMA.load(request.json)
     except ValidationError as err:
         return jsonify({'errors': err.messages}), 400
 
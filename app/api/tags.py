@@ -1,40 +1,45 @@
 """API endpoints for tags."""
 
-from flask import request, jsonify
+from flask import request, jsonify, g
 from marshmallow import ValidationError
+from sqlalchemy import select
 
 from app.api import api_bp
 from app.extensions import db
 from app.models import Tag
 from app.schemas import TagSchema
 
+_TAG_SCHEMA = TagSchema()
+
 
 @api_bp.route('/tags', methods=['GET'])
 def list_tags():
     """List all tags for current user."""
-    from app.services.user_service import get_current_user_id
-    user_id = get_current_user_id()
-    tags = Tag.query.filter_by(user_id=user_id).order_by(Tag.name).all()
+    user_id = g.user_id
+    # Plain rows in the Tag.to_dict() shape; no ORM objects needed for a read
+    rows = db.session.execute(
+        select(Tag.id, Tag.name, Tag.color).where(Tag.user_id == user_id).order_by(Tag.name)
+    )
     return jsonify({
-        'tags': [tag.to_dict() for tag in tags]
+        'tags': [dict(row._mapping) for row in rows]
     })
 
 
 @api_bp.route('/tags', methods=['POST'])
 def create_tag():
     """Create a new tag."""
-    from app.services.user_service import get_current_user_id
-    user_id = get_current_user_id()
-    schema = TagSchema()
+    user_id = g.user_id
 
     try:
-        data = schema.load(request.json)
+        data = _TAG_SCHEMA.load(request.json)
     except ValidationError as err:
         return jsonify({'errors': err.messages}), 400
 
     # Check if tag with same name exists for this user
-    existing = Tag.query.filter_by(name=data['name'], user_id=user_id).first()
-    if existing:
+    existing_id = db.session.scalar(
+        select(Tag.id).where(Tag.name == data['name'], Tag.user_id == user_id).limit(1)
+    )
+    if existing_id is not None:
         return jsonify({'error': 'Tag with this name already exists'}), 400
 
     data['user_id'] = user_id
@@ -48,19 +53,19 @@ def create_tag():
 @api_bp.route('/tags/<int:id>', methods=['PUT'])
 def update_tag(id):
     """Update a tag."""
-    from app.services.user_service import get_current_user_id
-    user_id = get_current_user_id()
+    user_id = g.user_id
     tag = Tag.query.filter_by(id=id, user_id=user_id).first_or_404()
-    schema = TagSchema()
 
     try:
-        data = schema.load(request.json)
+        data = _TAG_SCHEMA.load(request.json)
     except ValidationError as err:
         return jsonify({'errors': err.messages}), 400
 
     # Check if another tag with same name exists for this user
-    existing = Tag.query.filter(Tag.name == data['name'], Tag.id != id, Tag.user_id == user_id).first()
-    if existing:
+    existing_id = db.session.scalar(
+        select(Tag.id).where(Tag.name == data['name'], Tag.id != id, Tag.user_id == user_id).limit(1)
+    )
+    if existing_id is not None:
         return jsonify({'error': 'Tag with this name already exists'}), 400
 
     for key, value in data.items():
@@ -74,8 +79,7 @@ def update_tag(id):
 @api_bp.route('/tags/<int:id>', methods=['DELETE'])
 def delete_tag(id):
     """Delete a tag."""
-    from app.services.user_service import get_current_user_id
-    user_id = get_current_user_id()
+    user_id = g.user_id
     tag = Tag.query.filter_by(id=id, user_id=user_id).first_or_404()
     db.session.delete(tag)
     db.session.commit()
@@ -0,0 +1,81 @@
+"""Optional Redis cache for read-heavy JSON endpoints.
+
+Caching is enabled only when REDIS_URL is configured. Every Redis call is
+best-effort: on an outage the request falls through to the database.
+"""
+
+import logging
+from functools import wraps
+
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+
+def init_cache(app):
+    """Attach a Redis client to the app when REDIS_URL is set."""
+    url = app.config.get('REDIS_URL')
+    if not url:
+        return
+    from redis import Redis
+    app.extensions['redis'] = Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+
+
+def _client():
+    return current_app.extensions.get('redis')
+
+
+def cache_get(key):
+    """Return the cached bytes for key, or None on a miss or outage."""
+    client = _client()
+    if client is None:
+        return None
+    try:
+        return client.get(key)
+    except Exception:
+        logger.warning('Cache read failed for %s', key, exc_info=True)
+        return None
+
+
+def cache_set(key, value, ttl):
+    """Store value under key for ttl seconds, ignoring outages."""
+    client = _client()
+    if client is None:
+        return
+    try:
+        client.setex(key, ttl, value)
+    except Exception:
+        logger.warning('Cache write failed for %s', key, exc_info=True)
+
+
+def cache_delete(*keys):
+    """Drop keys from the cache, ignoring outages."""
+    client = _client()
+    if client is None:
+        return
+    try:
+        client.delete(*keys)
+    except Exception:
+        logger.warning('Cache invalidation failed for %s', keys, exc_info=True)
+
+
+def cached_json(key, ttl_setting):
+    """Cache a view's successful JSON response body in Redis.
+
+    Args:
+        key: Cache key for the response.
+        ttl_setting: Config key holding the TTL in seconds.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            cached = cache_get(key)
+            if cached is not None:
+                return current_app.response_class(cached, mimetype='application/json')
+
+            response = current_app.make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                cache_set(key, response.get_data(), current_app.config[ttl_setting])
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,120 @@
+"""CLI commands for database setup and maintenance."""
+
+import click
+from sqlalchemy import text
+
+from app.extensions import db
+
+
+def cleanup_imported_notes():
+    """Strip email subjects from the notes of imported applications.
+
+    Returns:
+        int: Number of applications updated.
+    """
+    from app.models import JobApplication
+
+    updated = JobApplication.query.filter(
+        JobApplication.notes.like('Imported from email:%'),
+        JobApplication.notes != 'Imported from email'
+    ).update(
+        {JobApplication.notes: 'Imported from email'},
+        synchronize_session=False
+    )
+    updated += JobApplication.query.filter(
+        JobApplication.notes.like('Created from response email:%')
+    ).update(
+        {JobApplication.notes: 'Imported from email'},
+        synchronize_session=False
+    )
+    db.session.commit()
+    return updated
+
+
+def create_missing_indexes():
+    """Create model indexes that existing tables don't have yet.
+
+    db.create_all() only creates missing tables, so indexes added to a model
+    after its table exists would otherwise never reach the database.
+    Indexes limited to another dialect with ddl_if() are skipped.
+
+    Returns:
+        int: Number of indexes created.
+    """
+    created = 0
+    with db.engine.begin() as connection:
+        # gin_trgm_ops indexes need the extension, even on tables created before them
+        if connection.dialect.name == 'postgresql':
+            connection.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+        def exists(index):
+            # SQLite's reflection skips expression indexes, so look the name up directly
+            if connection.dialect.name == 'sqlite':
+                return connection.scalar(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = :name"),
+                    {'name': index.name}
+                ) is not None
+            return connection.dialect.has_index(connection, index.table.name, index.name)
+
+        for table in db.metadata.sorted_tables:
+            missing = [index for index in table.indexes if not exists(index)]
+            for index in missing:
+                index.create(connection)
+            created += sum(1 for index in missing if exists(index))
+    return created
+
+
+def sync_dashboard_counters(strategy):
+    """Install the counter trigger for the 'counters' strategy and remove it otherwise.
+
+    Only touches job_applications when the trigger has to be added or
+    dropped, so repeated runs take no table locks. PostgreSQL only.
+
+    Returns:
+        str: 'installed', 'removed' or None when nothing changed.
+    """
+    from app.models.dashboard import (
+        application_counters_installed, install_application_counters, remove_application_counters,
+    )
+
+    with db.engine.begin() as connection:
+        if connection.dialect.name != 'postgresql':
+            return None
+        installed = application_counters_installed(connection)
+        if strategy == 'counters' and not installed:
+            install_application_counters(connection)
+            return 'installed'
+        if strategy != 'counters' and installed:
+            remove_application_counters(connection)
+            return 'removed'
+    return None
+
+
+def register_commands(app):
+    """Register CLI commands on the application."""
+
+    @app.cli.command('init-db')
+    def init_db():
+        """Create missing tables and indexes and run one-time data cleanups."""
+        db.create_all()
+        indexes = create_missing_indexes()
+        counters = sync_dashboard_counters(app.config.get('DASHBOARD_AGGREGATES'))
+        updated = cleanup_imported_notes()
+        click.echo(f'Database ready. Created {indexes} indexes; cleaned notes on {updated} applications.')
+        if counters:
+            click.echo(f'Dashboard counter trigger {counters}.')
+
+    @app.cli.command('refresh-dashboard')
+    def refresh_dashboard():
+        """Refresh the dashboard materialized views (PostgreSQL only)."""
+        from app.api.dashboard import DASHBOARD_CACHE_KEYS
+        from app.cache import cache_delete
+        from app.models.dashboard import refresh_dashboard_views
+
+        if db.engine.dialect.name != 'postgresql':
+            click.echo('Dashboard views are only used on PostgreSQL; nothing to refresh.')
+            return
+        with db.engine.begin() as connection:
+            refresh_dashboard_views(connection)
+        # Cached responses were computed from the old view contents
+        cache_delete(*DASHBOARD_CACHE_KEYS)
+        click.echo('Dashboard views refreshed.')
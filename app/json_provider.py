@@ -0,0 +1,59 @@
+"""JSON provider that serializes responses with orjson."""
+
+import orjson
+from flask import current_app
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Drop-in replacement for Flask's JSON provider backed by orjson.
+
+    Keys are sorted to match Flask's default output. Types orjson can't
+    encode natively (Decimal, etc.) fall back to Flask's default handler.
+    Parsing still uses the stdlib so request bodies are read exactly as before.
+    """
+
+    option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+    def _dump_bytes(self, obj, indent=False):
+        option = self.option | orjson.OPT_INDENT_2 if indent else self.option
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self._dump_bytes(obj, indent=bool(kwargs.get('indent'))).decode()
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            self._dump_bytes(obj, indent=indent) + b'\n', mimetype=self.mimetype
+        )
+
+    def stream_response(self, payload, stream_key):
+        """Stream payload as a JSON object, encoding payload[stream_key] item by item.
+
+        The iterable under stream_key is written first, one encoded element at
+        a time, so the full array is never held in memory as a single string.
+        The generator must not touch the database: it runs after the request's
+        app context (and its session) has been torn down.
+        """
+        items = payload[stream_key]
+        rest = {key: value for key, value in payload.items() if key != stream_key}
+
+        def generate():
+            yield b'{' + orjson.dumps(stream_key) + b':['
+            for i, item in enumerate(items):
+                if i:
+                    yield b','
+                yield self._dump_bytes(item)
+            yield b']'
+            for key in sorted(rest):
+                yield b',' + orjson.dumps(key) + b':' + self._dump_bytes(rest[key])
+            yield b'}\n'
+
+        return self._app.response_class(generate(), mimetype=self.mimetype)
+
+
+def stream_jsonify(payload, stream_key):
+    """Like jsonify(payload), but streams the list stored under stream_key."""
+    return current_app.json.stream_response(payload, stream_key)
@@ -5,6 +5,7 @@ from app.models.interview import InterviewStage
 from app.models.contact import Contact
 from app.models.tag import Tag, application_tags
 from app.models.email_settings import EmailSettings, ParsedEmail
+from app.models.dashboard import dashboard_stats_view, timeline_daily_view, application_counters
 
 __all__ = [
     'JobApplication',
@@ -14,4 +15,7 @@ __all__ = [
     'application_tags',
     'EmailSettings',
     'ParsedEmail',
+    'dashboard_stats_view',
+    'timeline_daily_view',
+    'application_counters',
 ]
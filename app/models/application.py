@@ -1,6 +1,7 @@
 """Job Application model."""
 
 from datetime import datetime, date
+from sqlalchemy import DDL, event, update
 from app.extensions import db
 
 
@@ -8,6 +9,30 @@ class JobApplication(db.Model):
     """Model for tracking job applications."""
 
     __tablename__ = 'job_applications'
+    __table_args__ = (
+        # Backs the default date_applied sort and seek pagination on (date_applied, id)
+        db.Index('ix_job_applications_user_date_applied_id', 'user_id', 'date_applied', 'id'),
+        db.Index('ix_job_applications_user_status', 'user_id', 'status'),
+        # Range scans for the dashboard timeline's 30-day window across all users
+        db.Index('ix_job_applications_date_applied', 'date_applied'),
+        # Partial index over only the applications that received a response
+        db.Index(
+            'ix_job_applications_user_responded', 'user_id',
+            postgresql_where=db.text('response_received = true'),
+            sqlite_where=db.text('response_received = 1'),
+        ),
+        # Trigram indexes so company_name/position ILIKE '%...%' can use an index on Postgres
+        db.Index(
+            'ix_job_applications_company_name_trgm', 'company_name',
+            postgresql_using='gin',
+            postgresql_ops={'company_name': 'gin_trgm_ops'},
+        ).ddl_if(dialect='postgresql'),
+        db.Index(
+            'ix_job_applications_position_trgm', 'position',
+            postgresql_using='gin',
+            postgresql_ops={'position': 'gin_trgm_ops'},
+        ).ddl_if(dialect='postgresql'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.String(255), nullable=True, index=True)  # Google user email/ID
@@ -28,21 +53,27 @@ class JobApplication(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
+    # Plain lists rather than 'dynamic' query objects: list endpoints batch
+    # them with selectinload() instead of issuing one query per application
     interviews = db.relationship(
         'InterviewStage',
-        backref='application',
+        back_populates='application',
         lazy='select',
+        order_by='InterviewStage.stage_number',
         cascade='all, delete-orphan'
     )
     contacts = db.relationship(
         'Contact',
-        backref='application',
-        lazy='dynamic',
+        back_populates='application',
+        lazy='select',
         cascade='all, delete-orphan'
     )
+    # 'selectin' batches tag loading for every query that returns applications,
+    # so to_dict() never lazy-loads tags per row regardless of the caller
     tags = db.relationship(
         'Tag',
         secondary='application_tags',
+        lazy='selectin',
         backref=db.backref('applications', lazy='dynamic')
     )
 
@@ -71,3 +102,29 @@ class JobApplication(db.Model):
             'interviews': [i.to_dict() for i in self.interviews],
             'tags': [t.to_dict() for t in self.tags],
         }
+
+
+# gin_trgm_ops needs the pg_trgm extension before the table's indexes are created
+event.listen(
+    JobApplication.__table__,
+    'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql')
+)
+
+
+def touch_applications(connection, *criteria):
+    """Bump updated_at on the applications matching criteria.
+
+    Called when rows that JobApplication.to_dict() embeds (tags, interviews)
+    change, so updated_at keeps reflecting the serialized state and the list
+    endpoint's ETag moves with it.
+    """
+    connection.execute(
+        update(JobApplication.__table__).where(*criteria).values(updated_at=datetime.utcnow())
+    )
+
+
+@event.listens_for(JobApplication.tags, 'append')
+@event.listens_for(JobApplication.tags, 'remove')
+def _tags_changed(target, value, initiator):
+    target.updated_at = datetime.utcnow()
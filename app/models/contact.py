@@ -8,10 +8,14 @@ class Contact(db.Model):
     """Model for tracking contacts/connections at companies (recruiters, hiring managers, etc.)."""
 
     __tablename__ = 'contacts'
+    __table_args__ = (
+        # Backs the newest-first listing and seek pagination on id
+        db.Index('ix_contacts_user_id_id', 'user_id', 'id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.String(255), nullable=True, index=True)  # Google user email/ID
-    application_id = db.Column(db.Integer, db.ForeignKey('job_applications.id'), nullable=True)
+    application_id = db.Column(db.Integer, db.ForeignKey('job_applications.id', ondelete='CASCADE'), nullable=True)
     name = db.Column(db.String(255), nullable=False)
     company = db.Column(db.String(255), nullable=True)  # Company name (for contacts not tied to an application)
     title = db.Column(db.String(255), nullable=True)  # Job title (e.g., "Recruiter", "Hiring Manager")
@@ -24,6 +28,8 @@ class Contact(db.Model):
     last_contact_date = db.Column(db.Date, nullable=True)  # When they last reached out
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    application = db.relationship('JobApplication', back_populates='contacts')
+
     def __repr__(self):
         return f'<Contact {self.name}>'
 
@@ -49,3 +55,8 @@ class Contact(db.Model):
             'last_contact_date': self.last_contact_date.isoformat() if self.last_contact_date else None,
             'created_at': self.created_at.isoformat() if self.created_at else None,
         }
+
+
+# Expression index behind the email scans' case-insensitive "already a contact?"
+# lookup (lower(name) IN ...). Not unique: manually added contacts may share a name.
+db.Index('ix_contacts_user_lower_name', Contact.user_id, db.func.lower(Contact.name))
@@ -0,0 +1,167 @@
+"""Pre-aggregated dashboard figures (PostgreSQL only).
+
+Two strategies are available, chosen by the DASHBOARD_AGGREGATES setting:
+materialized views refreshed on a schedule, or a counter table kept exact
+by triggers on job_applications (installed by `flask init-db`).
+"""
+
+from sqlalchemy import DDL, column, event, table, text
+from app.extensions import db
+
+
+# Application counts rolled up by the dimensions the dashboard filters on
+dashboard_stats_view = table(
+    'mv_dashboard_stats',
+    column('user_id'),
+    column('status'),
+    column('response_received'),
+    column('date_applied'),
+    column('app_count'),
+)
+
+# Daily application counts for the timeline chart
+timeline_daily_view = table(
+    'mv_timeline_daily',
+    column('user_id'),
+    column('date_applied'),
+    column('app_count'),
+)
+
+# Application counts per (user, status, response, day), maintained by triggers.
+# Nullable dimensions are stored coalesced ('' / false) so they can form the key.
+application_counters = table(
+    'application_counters',
+    column('user_id'),
+    column('status'),
+    column('response_received'),
+    column('date_applied'),
+    column('app_count'),
+)
+
+# One row recording when the materialized views were last refreshed. Dashboard
+# ETags include it, since a refresh changes the figures without any write.
+dashboard_refresh = table(
+    'dashboard_refresh',
+    column('refreshed_at'),
+)
+
+MATERIALIZED_VIEWS = ('mv_dashboard_stats', 'mv_timeline_daily')
+
+# REFRESH ... CONCURRENTLY needs a unique index covering every row of the view
+_CREATE_STATEMENTS = (
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS mv_dashboard_stats AS
+    SELECT user_id, status, response_received, date_applied, count(*) AS app_count
+    FROM job_applications
+    GROUP BY user_id, status, response_received, date_applied
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_dashboard_stats
+    ON mv_dashboard_stats (user_id, status, response_received, date_applied)
+    """,
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS mv_timeline_daily AS
+    SELECT user_id, date_applied, count(*) AS app_count
+    FROM job_applications
+    GROUP BY user_id, date_applied
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_timeline_daily
+    ON mv_timeline_daily (user_id, date_applied)
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS dashboard_refresh (
+        id boolean PRIMARY KEY DEFAULT true CHECK (id),
+        refreshed_at timestamptz NOT NULL
+    )
+    """,
+)
+
+# Each row-level change moves one application out of its old bucket and into
+# its new one. Installed by install_application_counters() only when the
+# 'counters' strategy is in use, since every application write pays for the
+# trigger. The backfill only runs while the counter table is empty.
+_COUNTER_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS application_counters (
+        user_id varchar(255) NOT NULL,
+        status varchar(50) NOT NULL,
+        response_received boolean NOT NULL,
+        date_applied date NOT NULL,
+        app_count integer NOT NULL,
+        PRIMARY KEY (user_id, status, response_received, date_applied)
+    )
+    """,
+    """
+    CREATE OR REPLACE FUNCTION bump_application_counters() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP <> 'INSERT' THEN
+            UPDATE application_counters SET app_count = app_count - 1
+            WHERE user_id = coalesce(OLD.user_id, '')
+              AND status = coalesce(OLD.status, '')
+              AND response_received = coalesce(OLD.response_received, false)
+              AND date_applied = OLD.date_applied;
+        END IF;
+        IF TG_OP <> 'DELETE' THEN
+            INSERT INTO application_counters (user_id, status, response_received, date_applied, app_count)
+            VALUES (coalesce(NEW.user_id, ''), coalesce(NEW.status, ''),
+                    coalesce(NEW.response_received, false), NEW.date_applied, 1)
+            ON CONFLICT (user_id, status, response_received, date_applied)
+            DO UPDATE SET app_count = application_counters.app_count + 1;
+        END IF;
+        RETURN NULL;
+    END;
+    $$
+    """,
+    """
+    CREATE TRIGGER trg_application_counters
+    AFTER INSERT OR DELETE OR UPDATE OF user_id, status, response_received, date_applied
+    ON job_applications
+    FOR EACH ROW EXECUTE FUNCTION bump_application_counters()
+    """,
+    """
+    INSERT INTO application_counters (user_id, status, response_received, date_applied, app_count)
+    SELECT coalesce(user_id, ''), coalesce(status, ''), coalesce(response_received, false), date_applied, count(*)
+    FROM job_applications
+    WHERE NOT EXISTS (SELECT 1 FROM application_counters)
+    GROUP BY 1, 2, 3, 4
+    """,
+)
+
+for _statement in _CREATE_STATEMENTS:
+    event.listen(db.metadata, 'after_create', DDL(_statement).execute_if(dialect='postgresql'))
+
+
+def application_counters_installed(connection):
+    """Whether the counter trigger exists on job_applications."""
+    return connection.scalar(
+        text("SELECT 1 FROM pg_trigger WHERE tgname = 'trg_application_counters'")
+    ) is not None
+
+
+def install_application_counters(connection):
+    """Create the counter table and trigger, backfilling from existing applications."""
+    for statement in _COUNTER_STATEMENTS:
+        connection.execute(text(statement))
+
+
+def remove_application_counters(connection):
+    """Drop the counter trigger and table; a later install backfills afresh."""
+    connection.execute(text('DROP TRIGGER IF EXISTS trg_application_counters ON job_applications'))
+    connection.execute(text('DROP TABLE IF EXISTS application_counters'))
+
+
+def refresh_dashboard_views(connection, concurrently=True):
+    """Recompute the dashboard materialized views.
+
+    CONCURRENTLY lets dashboard reads continue against the old contents while
+    the refresh runs.
+    """
+    mode = ' CONCURRENTLY' if concurrently else ''
+    for name in MATERIALIZED_VIEWS:
+        connection.execute(text(f'REFRESH MATERIALIZED VIEW{mode} {name}'))
+    connection.execute(text(
+        'INSERT INTO dashboard_refresh (id, refreshed_at) VALUES (true, now()) '
+        'ON CONFLICT (id) DO UPDATE SET refreshed_at = EXCLUDED.refreshed_at'
+    ))
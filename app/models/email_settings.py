@@ -38,6 +38,12 @@ class ParsedEmail(db.Model):
     """Store parsed job application emails."""
 
     __tablename__ = 'parsed_emails'
+    __table_args__ = (
+        # Backs the parsed-email list: filter by user and status, newest email first
+        db.Index('ix_parsed_emails_user_status_email_date', 'user_id', 'status', 'email_date'),
+        # Bulk application deletes null out application_id on linked emails
+        db.Index('ix_parsed_emails_application_id', 'application_id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.String(255), nullable=True, index=True)  # Google user email/ID
@@ -55,7 +61,7 @@ class ParsedEmail(db.Model):
 
     # Status
     status = db.Column(db.String(50), default='pending')  # pending, imported, ignored
-    application_id = db.Column(db.Integer, db.ForeignKey('job_applications.id'), nullable=True)
+    application_id = db.Column(db.Integer, db.ForeignKey('job_applications.id', ondelete='SET NULL'), nullable=True)
 
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
@@ -1,16 +1,28 @@
 """Interview Stage model."""
 
 from datetime import datetime
+from sqlalchemy import event
 from app.extensions import db
+from app.models.application import JobApplication, touch_applications
 
 
 class InterviewStage(db.Model):
     """Model for tracking interview stages."""
 
     __tablename__ = 'interview_stages'
+    __table_args__ = (
+        # Parent lookups (interview loading, cascades) and the funnel's max(stage_number) per application
+        db.Index('ix_interview_stages_application_stage', 'application_id', 'stage_number'),
+        # Partial index over only the interviews still to happen, for the upcoming count
+        db.Index(
+            'ix_interview_stages_upcoming', 'scheduled_date',
+            postgresql_where=db.text('completed_date IS NULL'),
+            sqlite_where=db.text('completed_date IS NULL'),
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
-    application_id = db.Column(db.Integer, db.ForeignKey('job_applications.id'), nullable=False)
+    application_id = db.Column(db.Integer, db.ForeignKey('job_applications.id', ondelete='CASCADE'), nullable=False)
     stage_number = db.Column(db.Integer, nullable=False)  # 1 = first interview, 2 = second, etc.
     stage_type = db.Column(db.String(100), nullable=True)  # phone_screen, technical, behavioral, onsite, final
     scheduled_date = db.Column(db.DateTime, nullable=True)
@@ -20,6 +32,8 @@ class InterviewStage(db.Model):
     outcome = db.Column(db.String(50), nullable=True)  # passed, failed, pending, cancelled
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    application = db.relationship('JobApplication', back_populates='interviews')
+
     def __repr__(self):
         return f'<InterviewStage {self.stage_number} for Application {self.application_id}>'
 
@@ -37,3 +51,10 @@ class InterviewStage(db.Model):
             'outcome': self.outcome,
             'created_at': self.created_at.isoformat() if self.created_at else None,
         }
+
+
+@event.listens_for(InterviewStage, 'after_insert')
+@event.listens_for(InterviewStage, 'after_update')
+@event.listens_for(InterviewStage, 'after_delete')
+def _interview_changed(mapper, connection, target):
+    touch_applications(connection, JobApplication.__table__.c.id == target.application_id)
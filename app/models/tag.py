@@ -1,13 +1,16 @@
 """Tag model."""
 
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
 from app.extensions import db
+from app.models.application import JobApplication, touch_applications
 
 
 # Association table for many-to-many relationship
 application_tags = db.Table(
     'application_tags',
-    db.Column('application_id', db.Integer, db.ForeignKey('job_applications.id'), primary_key=True),
-    db.Column('tag_id', db.Integer, db.ForeignKey('tags.id'), primary_key=True)
+    db.Column('application_id', db.Integer, db.ForeignKey('job_applications.id', ondelete='CASCADE'), primary_key=True),
+    db.Column('tag_id', db.Integer, db.ForeignKey('tags.id', ondelete='CASCADE'), primary_key=True)
 )
 
 
@@ -15,6 +18,10 @@ class Tag(db.Model):
     """Model for categorizing applications with tags."""
 
     __tablename__ = 'tags'
+    __table_args__ = (
+        # Serves the per-user name lookups in create/update_tag and list_tags' ORDER BY name
+        db.Index('ix_tags_user_name', 'user_id', 'name'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.String(255), nullable=True, index=True)  # Google user email/ID
@@ -31,3 +38,26 @@ class Tag(db.Model):
             'name': self.name,
             'color': self.color,
         }
+
+
+def _touch_tagged_applications(connection, tag_id):
+    touch_applications(
+        connection,
+        JobApplication.__table__.c.id.in_(
+            select(application_tags.c.application_id).where(application_tags.c.tag_id == tag_id)
+        )
+    )
+
+
+@event.listens_for(Tag, 'after_update')
+def _tag_updated(mapper, connection, target):
+    _touch_tagged_applications(connection, target.id)
+
+
+@event.listens_for(Session, 'before_flush')
+def _tags_deleting(session, flush_context, instances):
+    # The flush removes association rows before the tag's own DELETE runs,
+    # so tagged applications have to be found before the flush starts
+    for obj in session.deleted:
+        if isinstance(obj, Tag):
+            _touch_tagged_applications(session.connection(), obj.id)
@@ -0,0 +1,42 @@
+"""Per-request SQL query counting, for catching N+1 regressions in development.
+
+Enabled by QUERY_COUNTING. Every response then carries an X-Query-Count
+header, and a request to an endpoint listed in QUERY_BUDGETS that runs more
+queries than its budget is logged as a warning.
+"""
+
+import logging
+
+from flask import g, has_app_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    # Only requests started a count; CLI commands and startup queries are ignored
+    if has_app_context() and 'query_count' in g:
+        g.query_count += 1
+
+
+def init_query_counter(app):
+    """Count the queries each request runs when QUERY_COUNTING is set."""
+    if not app.config.get('QUERY_COUNTING'):
+        return
+    if not event.contains(Engine, 'before_cursor_execute', _count_query):
+        event.listen(Engine, 'before_cursor_execute', _count_query)
+    budgets = app.config.get('QUERY_BUDGETS', {})
+
+    @app.before_request
+    def _start_query_count():
+        g.query_count = 0
+
+    @app.after_request
+    def _report_query_count(response):
+        count = g.pop('query_count', 0)
+        response.headers['X-Query-Count'] = str(count)
+        budget = budgets.get(request.endpoint)
+        if budget is not None and count > budget:
+            logger.warning('%s ran %d queries (budget %d)', request.endpoint, count, budget)
+        return response
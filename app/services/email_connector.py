@@ -2,12 +2,88 @@
 
 import base64
 import email
-from datetime import datetime, timedelta
-from typing import List, Optional
+import queue
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator, List, Optional
 from email.utils import parsedate_to_datetime
 
+from dateutil import parser as dateutil_parser
+from googleapiclient.errors import HttpError
+
 from app.services.google_oauth import get_gmail_service, refresh_access_token
 
+# Message GETs per batch request; Gmail accepts 100 but throttles batches over 50
+_GET_BATCH_SIZE = 50
+# A full batch spends Gmail's per-user quota for about a second, so GETs that
+# come back rate limited (or hit a server error) are re-sent after a backoff
+_GET_RETRIES = 4
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Fallback for malformed Date headers: just the "15 Oct 2026" portion
+_DATE_PORTION_RE = re.compile(r'(\d{1,2}\s+\w+\s+\d{4})')
+# HTML-to-text passes, run on every HTML message body
+_SCRIPT_RE = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL | re.IGNORECASE)
+_BREAK_RE = re.compile(r'<br\s*/?>', re.IGNORECASE)
+_BLOCK_TAG_RE = re.compile(r'</?(?:p|div|tr|li|h[1-6])[^>]*>', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_INLINE_SPACE_RE = re.compile(r'[ \t]+')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+
+def _newest_first(emails: Iterable[dict]) -> List[dict]:
+    """Collect emails sorted by date descending (undated last)."""
+    aware_min = datetime.min.replace(tzinfo=timezone.utc)
+    return sorted(emails, key=lambda x: x['date'] if x['date'] else aware_min, reverse=True)
+
+
+def prefetch(items: Iterable, maxsize: int = 64) -> Iterator:
+    """
+    Yield from items while a background thread keeps producing ahead.
+
+    Lets the caller parse one email while the next ones are still being
+    downloaded. Only the producer thread touches the iterable (the Gmail
+    client is not thread-safe), at most maxsize items are buffered, and an
+    exception raised while producing is re-raised to the caller.
+    """
+    buffer = queue.Queue(maxsize=maxsize)
+    stopped = threading.Event()
+    done = object()
+
+    def offer(item):
+        # Give up if the consumer went away instead of blocking forever on a full buffer
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not offer((item, None)):
+                    return
+        except Exception as e:
+            offer((done, e))
+        else:
+            offer((done, None))
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if error is not None:
+                raise error
+            if item is done:
+                return
+            yield item
+    finally:
+        stopped.set()
+
 
 class GmailOAuthConnector:
     """Connect to Gmail via OAuth to fetch job-related emails."""
@@ -62,6 +138,10 @@ class GmailOAuthConnector:
         Returns:
             List of email dictionaries with subject, from, date, body
         """
+        return _newest_first(self.iter_job_emails(days_back, limit))
+
+    def iter_job_emails(self, days_back: int = 30, limit: int = 200) -> Iterator[dict]:
+        """Yield job emails as they are downloaded, in search order rather than by date."""
         if not self.service:
             raise ConnectionError("Not connected. Call connect() first.")
 
@@ -87,59 +167,7 @@ class GmailOAuthConnector:
             f'after:{after_date} from:careers@ OR from:jobs@',
         ]
 
-        emails = []
-        seen_ids = set()
-
-        for query in search_queries:
-            # Stop early if we have enough emails
-            if len(emails) >= limit:
-                break
-
-            try:
-                results = self.service.users().messages().list(
-                    userId='me',
-                    q=query,
-                    maxResults=30  # Reduced from 50 to speed up queries
-                ).execute()
-
-                messages = results.get('messages', [])
-
-                for msg_info in messages:
-                    if msg_info['id'] in seen_ids:
-                        continue
-
-                    seen_ids.add(msg_info['id'])
-
-                    try:
-                        msg = self.service.users().messages().get(
-                            userId='me',
-                            id=msg_info['id'],
-                            format='full'
-                        ).execute()
-
-                        parsed = self._parse_message(msg)
-                        if parsed:
-                            emails.append(parsed)
-
-                        if len(emails) >= limit:
-                            break
-
-                    except Exception as e:
-                        print(f"Error fetching message {msg_info['id']}: {e}")
-                        continue
-
-            except Exception as e:
-                print(f"Error with query '{query}': {e}")
-                continue
-
-            if len(emails) >= limit:
-                break
-
-        # Sort by date descending (use a timezone-aware min date as fallback)
-        from datetime import timezone
-        aware_min = datetime.min.replace(tzinfo=timezone.utc)
-        emails.sort(key=lambda x: x['date'] if x['date'] else aware_min, reverse=True)
-        return emails[:limit]
+        yield from self._iter_search(search_queries, 30, limit)
 
     def fetch_recruiter_emails(self, days_back: int = 90, limit: int = 100) -> List[dict]:
         """
@@ -176,53 +204,7 @@ class GmailOAuthConnector:
             f'after:{after_date} subject:"your application" {platform_exclusions}',
         ]
 
-        emails = []
-        seen_ids = set()
-
-        for query in search_queries:
-            if len(emails) >= limit:
-                break
-
-            try:
-                results = self.service.users().messages().list(
-                    userId='me',
-                    q=query,
-                    maxResults=25
-                ).execute()
-
-                messages = results.get('messages', [])
-
-                for msg_info in messages:
-                    if msg_info['id'] in seen_ids:
-                        continue
-                    seen_ids.add(msg_info['id'])
-
-                    try:
-                        msg = self.service.users().messages().get(
-                            userId='me',
-                            id=msg_info['id'],
-                            format='full'
-                        ).execute()
-
-                        parsed = self._parse_message(msg)
-                        if parsed:
-                            emails.append(parsed)
-
-                        if len(emails) >= limit:
-                            break
-
-                    except Exception as e:
-                        print(f"Error fetching recruiter message {msg_info['id']}: {e}")
-                        continue
-
-            except Exception as e:
-                print(f"Error with recruiter query '{query}': {e}")
-                continue
-
-        from datetime import timezone
-        aware_min = datetime.min.replace(tzinfo=timezone.utc)
-        emails.sort(key=lambda x: x['date'] if x['date'] else aware_min, reverse=True)
-        return emails[:limit]
+        return _newest_first(self._iter_search(search_queries, 25, limit, 'recruiter '))
 
     def fetch_response_emails(self, days_back: int = 60, limit: int = 150) -> List[dict]:
         """
@@ -240,6 +222,10 @@ class GmailOAuthConnector:
         Returns:
             List of email dictionaries
         """
+        return _newest_first(self.iter_response_emails(days_back, limit))
+
+    def iter_response_emails(self, days_back: int = 60, limit: int = 150) -> Iterator[dict]:
+        """Yield response emails as they are downloaded, in search order rather than by date."""
         if not self.service:
             raise ConnectionError("Not connected. Call connect() first.")
 
@@ -274,53 +260,91 @@ class GmailOAuthConnector:
             f'after:{after_date} filename:ics subject:(interview OR meeting OR call)',
         ]
 
-        emails = []
+        yield from self._iter_search(search_queries, 25, limit, 'response ')
+
+    def _iter_search(self, search_queries: List[str], max_results: int, limit: int, kind: str = '') -> Iterator[dict]:
+        """
+        Run Gmail searches in order and yield each new matching message.
+
+        Args:
+            search_queries: Gmail search strings, most important first
+            max_results: Messages listed per search
+            limit: Stop after this many messages
+            kind: Label for error logging, e.g. 'response '
+        """
+        count = 0
         seen_ids = set()
 
         for query in search_queries:
-            if len(emails) >= limit:
+            if count >= limit:
                 break
 
             try:
                 results = self.service.users().messages().list(
                     userId='me',
                     q=query,
-                    maxResults=25
+                    maxResults=max_results
                 ).execute()
 
-                messages = results.get('messages', [])
-
-                for msg_info in messages:
-                    if msg_info['id'] in seen_ids:
-                        continue
-                    seen_ids.add(msg_info['id'])
-
-                    try:
-                        msg = self.service.users().messages().get(
-                            userId='me',
-                            id=msg_info['id'],
-                            format='full'
-                        ).execute()
-
+                new_ids = []
+                for msg_info in results.get('messages', []):
+                    if msg_info['id'] not in seen_ids:
+                        seen_ids.add(msg_info['id'])
+                        new_ids.append(msg_info['id'])
+
+                # Fetch no more than could still be used, topping up when
+                # some of those fail or don't parse
+                while new_ids and count < limit:
+                    wanted, new_ids = new_ids[:limit - count], new_ids[limit - count:]
+                    for msg in self._get_messages(wanted, kind):
                         parsed = self._parse_message(msg)
                         if parsed:
-                            emails.append(parsed)
-
-                        if len(emails) >= limit:
-                            break
-
-                    except Exception as e:
-                        print(f"Error fetching response message {msg_info['id']}: {e}")
-                        continue
+                            count += 1
+                            yield parsed
 
             except Exception as e:
-                print(f"Error with response query '{query}': {e}")
+                print(f"Error with {kind}query '{query}': {e}")
                 continue
 
-        from datetime import timezone
-        aware_min = datetime.min.replace(tzinfo=timezone.utc)
-        emails.sort(key=lambda x: x['date'] if x['date'] else aware_min, reverse=True)
-        return emails[:limit]
+    def _get_messages(self, message_ids: List[str], kind: str = '') -> List[dict]:
+        """
+        Fetch full messages, packing up to _GET_BATCH_SIZE GETs into each HTTP request.
+
+        GETs that are rate limited or hit a server error are re-sent, with
+        exponential backoff, up to _GET_RETRIES times. Returns the messages
+        in message_ids order; ones that still failed are logged and left out.
+        """
+        fetched = {}
+        throttled = []
+
+        def collect(request_id, response, exception):
+            if exception is None:
+                fetched[request_id] = response
+            elif isinstance(exception, HttpError) and exception.resp.status in _RETRY_STATUSES:
+                throttled.append(request_id)
+            else:
+                print(f"Error fetching {kind}message {request_id}: {exception}")
+
+        pending = message_ids
+        for attempt in range(_GET_RETRIES + 1):
+            if attempt:
+                time.sleep(2 ** (attempt - 1))
+            throttled.clear()
+            for start in range(0, len(pending), _GET_BATCH_SIZE):
+                batch = self.service.new_batch_http_request(callback=collect)
+                for message_id in pending[start:start + _GET_BATCH_SIZE]:
+                    batch.add(
+                        self.service.users().messages().get(userId='me', id=message_id, format='full'),
+                        request_id=message_id
+                    )
+                batch.execute()
+            if not throttled:
+                break
+            pending = list(throttled)
+        else:
+            print(f"Gave up on {len(throttled)} {kind}messages still rate limited after {_GET_RETRIES} retries")
+
+        return [fetched[message_id] for message_id in message_ids if message_id in fetched]
 
     def _parse_message(self, msg: dict) -> Optional[dict]:
         """Parse a Gmail API message into a dictionary."""
@@ -342,22 +366,18 @@ class GmailOAuthConnector:
                 except Exception:
                     # Try alternative parsing for malformed dates
                     try:
-                        from dateutil import parser as dateutil_parser
                         msg_date = dateutil_parser.parse(date_str)
                     except Exception:
                         # Last resort: extract just the date portion
-                        import re
-                        date_match = re.search(r'(\d{1,2}\s+\w+\s+\d{4})', date_str)
+                        date_match = _DATE_PORTION_RE.search(date_str)
                         if date_match:
                             try:
-                                from dateutil import parser as dateutil_parser
                                 msg_date = dateutil_parser.parse(date_match.group(1))
                             except Exception:
                                 msg_date = None
 
                 # Ensure all dates are timezone-aware to prevent comparison errors
                 if msg_date and msg_date.tzinfo is None:
-                    from datetime import timezone
                     msg_date = msg_date.replace(tzinfo=timezone.utc)
 
             # Get body text
@@ -433,18 +453,16 @@ class GmailOAuthConnector:
 
     def _html_to_text(self, html: str) -> str:
         """Convert HTML to plain text, preserving important content."""
-        import re
-
         # Remove script and style tags
-        text = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
+        text = _SCRIPT_RE.sub('', html)
+        text = _STYLE_RE.sub('', text)
 
         # Replace common block elements with newlines
-        text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'</?(?:p|div|tr|li|h[1-6])[^>]*>', '\n', text, flags=re.IGNORECASE)
+        text = _BREAK_RE.sub('\n', text)
+        text = _BLOCK_TAG_RE.sub('\n', text)
 
         # Remove remaining HTML tags
-        text = re.sub(r'<[^>]+>', ' ', text)
+        text = _TAG_RE.sub(' ', text)
 
         # Decode HTML entities
         text = text.replace('&nbsp;', ' ')
@@ -455,8 +473,8 @@ class GmailOAuthConnector:
         text = text.replace('&#39;', "'")
 
         # Clean up whitespace
-        text = re.sub(r'[ \t]+', ' ', text)
-        text = re.sub(r'\n\s*\n', '\n\n', text)
+        text = _INLINE_SPACE_RE.sub(' ', text)
+        text = _BLANK_LINES_RE.sub('\n\n', text)
 
         return text.strip()
 
@@ -1049,6 +1049,13 @@ class JobEmailParser:
         r'looking forward to (hearing|connecting)',
     ]
 
+    # Response-type classifiers, compiled once when the class is defined
+    _REJECTION_RES = tuple(re.compile(p, re.IGNORECASE) for p in REJECTION_PATTERNS)
+    _INTERVIEW_RES = tuple(re.compile(p, re.IGNORECASE) for p in INTERVIEW_PATTERNS)
+    _OFFER_RES = tuple(re.compile(p, re.IGNORECASE) for p in OFFER_PATTERNS)
+    _EMPLOYER_MESSAGE_RES = tuple(re.compile(p, re.IGNORECASE) for p in EMPLOYER_MESSAGE_PATTERNS)
+    _RECRUITER_OUTREACH_RES = tuple(re.compile(p, re.IGNORECASE) for p in RECRUITER_OUTREACH_PATTERNS)
+
     # Additional patterns for extracting company from RESPONSE emails
     # These are patterns more common in rejection/interview emails vs confirmation emails
     RESPONSE_COMPANY_PATTERNS = [
@@ -1306,8 +1313,8 @@ class JobEmailParser:
             return False
 
         # Check for employer message patterns
-        message_count = sum(1 for pattern in self.EMPLOYER_MESSAGE_PATTERNS
-                           if re.search(pattern, text, re.IGNORECASE))
+        message_count = sum(1 for pattern in self._EMPLOYER_MESSAGE_RES
+                           if pattern.search(text))
 
         # If 1+ employer message patterns match and it's from a job platform, it's an employer message
         if message_count >= 1:
@@ -1323,8 +1330,8 @@ class JobEmailParser:
         text = (subject + ' ' + body[:3000]).lower()
 
         # Count how many outreach patterns match
-        outreach_count = sum(1 for pattern in self.RECRUITER_OUTREACH_PATTERNS
-                            if re.search(pattern, text, re.IGNORECASE))
+        outreach_count = sum(1 for pattern in self._RECRUITER_OUTREACH_RES
+                            if pattern.search(text))
 
         # If 2+ outreach patterns match, this is likely recruiter outreach
         if outreach_count >= 2:
@@ -1402,15 +1409,15 @@ class JobEmailParser:
         is_personal = any(domain in from_lower for domain in personal_domains)
 
         # Check for offer first (highest priority)
-        offer_count = sum(1 for pattern in self.OFFER_PATTERNS
-                         if re.search(pattern, text, re.IGNORECASE))
+        offer_count = sum(1 for pattern in self._OFFER_RES
+                         if pattern.search(text))
         if offer_count >= 2:
             return 'offered'
 
         # Check for interview request - but require stronger evidence
         # to avoid false positives from recruiter outreach
-        interview_count = sum(1 for pattern in self.INTERVIEW_PATTERNS
-                             if re.search(pattern, text, re.IGNORECASE))
+        interview_count = sum(1 for pattern in self._INTERVIEW_RES
+                             if pattern.search(text))
 
         # Also check for phrases that indicate this is about YOUR application
         application_reference_patterns = [
@@ -1448,8 +1455,8 @@ class JobEmailParser:
 
         # Check for rejection (skip if from personal email - likely a personal reply)
         if not is_personal:
-            rejection_count = sum(1 for pattern in self.REJECTION_PATTERNS
-                                 if re.search(pattern, text, re.IGNORECASE))
+            rejection_count = sum(1 for pattern in self._REJECTION_RES
+                                 if pattern.search(text))
             if rejection_count >= 1:
                 return 'rejected'
 
@@ -4,12 +4,26 @@ import traceback
 from datetime import date, datetime
 from flask import render_template, request, redirect, url_for, flash
 from decimal import Decimal
-from sqlalchemy import or_, case
+from sqlalchemy import or_, case, exists, func, select
+from sqlalchemy.orm import selectinload
 
 from app.views import views_bp
 from app.extensions import db
 from app.models import JobApplication, InterviewStage, EmailSettings
 
+# Statuses shown in the dashboard's status breakdown cards
+STATUS_BREAKDOWN = ('applied', 'interviewing', 'offered', 'rejected', 'withdrawn', 'follow_up')
+
+
+def _count_where(condition):
+    """Conditional COUNT aggregate: rows matching condition."""
+    return func.count(case((condition, 1)))
+
+
+def _status_columns():
+    """One labelled conditional count per breakdown status."""
+    return [_count_where(JobApplication.status == status).label(status) for status in STATUS_BREAKDOWN]
+
 
 @views_bp.route('/')
 def dashboard():
@@ -34,8 +48,7 @@ def application_detail(id):
     user_id = get_current_user_id()
     application = JobApplication.query.filter_by(id=id, user_id=user_id).first_or_404()
     return render_template('pages/application_detail.html',
-                         application=application,
-                         Interview=InterviewStage)
+                         application=application)
 
 
 @views_bp.route('/settings/email')
@@ -226,69 +239,43 @@ def edit_application(id):
 @views_bp.route('/partials/stats')
 def stats_partial():
     """Return dashboard stats as HTML partial."""
-    from sqlalchemy import func
     from datetime import timedelta
     from app.services.user_service import get_current_user_id
 
     user_id = get_current_user_id()
-
-    # Base query filtered by user
-    base_query = JobApplication.query.filter_by(user_id=user_id)
-
-    total = base_query.count()
-
-    # Status counts
-    status_counts = db.session.query(
-        JobApplication.status,
-        func.count(JobApplication.id)
-    ).filter(JobApplication.user_id == user_id).group_by(JobApplication.status).all()
-    status_dict = {status: count for status, count in status_counts}
-
-    # Response rate
-    with_response = base_query.filter_by(response_received=True).count()
-    response_rate = (with_response / total * 100) if total > 0 else 0
+    week_ago = date.today() - timedelta(days=7)
+    month_ago = date.today() - timedelta(days=30)
 
     # Interview rate — count applications that reached interview stage.
     # Includes: status='interviewing'/'offered' (set by email scan or manually)
     # OR applications that have at least one InterviewStage record logged.
-    apps_with_interviews = base_query.filter(
-        or_(
-            JobApplication.status.in_(['interviewing', 'offered']),
-            JobApplication.id.in_(
-                db.session.query(InterviewStage.application_id).filter(
-                    InterviewStage.application_id == JobApplication.id
-                )
-            )
-        )
-    ).count()
-    interview_rate = (apps_with_interviews / total * 100) if total > 0 else 0
+    reached_interview = or_(
+        JobApplication.status.in_(['interviewing', 'offered']),
+        exists().where(InterviewStage.application_id == JobApplication.id)
+    )
 
-    # Recent applications
-    week_ago = date.today() - timedelta(days=7)
-    recent_week = base_query.filter(
-        JobApplication.date_applied >= week_ago
-    ).count()
+    # Every figure comes from one aggregate over the user's applications
+    counts = db.session.execute(select(
+        func.count(JobApplication.id).label('total'),
+        _count_where(JobApplication.response_received.is_(True)).label('with_response'),
+        _count_where(reached_interview).label('apps_with_interviews'),
+        _count_where(JobApplication.date_applied >= week_ago).label('recent_week'),
+        _count_where(JobApplication.date_applied >= month_ago).label('recent_month'),
+        *_status_columns(),
+    ).where(JobApplication.user_id == user_id)).one()
 
-    month_ago = date.today() - timedelta(days=30)
-    recent_month = base_query.filter(
-        JobApplication.date_applied >= month_ago
-    ).count()
+    total = counts.total
+    response_rate = (counts.with_response / total * 100) if total > 0 else 0
+    interview_rate = (counts.apps_with_interviews / total * 100) if total > 0 else 0
 
     stats = {
         'total_applications': total,
-        'status_breakdown': {
-            'applied': status_dict.get('applied', 0),
-            'interviewing': status_dict.get('interviewing', 0),
-            'offered': status_dict.get('offered', 0),
-            'rejected': status_dict.get('rejected', 0),
-            'withdrawn': status_dict.get('withdrawn', 0),
-            'follow_up': status_dict.get('follow_up', 0),
-        },
+        'status_breakdown': {status: counts._mapping[status] for status in STATUS_BREAKDOWN},
         'response_rate': round(response_rate, 1),
         'interview_rate': round(interview_rate, 1),
         'recent_applications': {
-            'last_7_days': recent_week,
-            'last_30_days': recent_month,
+            'last_7_days': counts.recent_week,
+            'last_30_days': counts.recent_month,
         },
     }
 
@@ -349,14 +336,16 @@ def stats_interview_breakdown():
     user_id = get_current_user_id()
 
     # Apps with interviews
+    # The template lists each application's interview count, so batch-load them
     with_interviews = JobApplication.query.filter_by(user_id=user_id)\
+        .options(selectinload(JobApplication.interviews))\
         .join(InterviewStage)\
         .distinct()\
         .order_by(JobApplication.date_applied.desc()).all()
 
     # Apps without interviews
     apps_with_interview_ids = [a.id for a in with_interviews]
-    base = JobApplication.query.filter_by(user_id=user_id)
+    base = JobApplication.query.filter_by(user_id=user_id).options(selectinload(JobApplication.interviews))
     if apps_with_interview_ids:
         without_interviews = base.filter(
             ~JobApplication.id.in_(apps_with_interview_ids)
@@ -405,29 +394,18 @@ def stats_weekly_breakdown():
 @views_bp.route('/partials/status-breakdown')
 def status_breakdown_partial():
     """Return status breakdown as HTML partial."""
-    from sqlalchemy import func
     from app.services.user_service import get_current_user_id
 
     user_id = get_current_user_id()
 
-    total = JobApplication.query.filter_by(user_id=user_id).count()
-
-    status_counts = db.session.query(
-        JobApplication.status,
-        func.count(JobApplication.id)
-    ).filter(JobApplication.user_id == user_id).group_by(JobApplication.status).all()
-    status_dict = {status: count for status, count in status_counts}
+    counts = db.session.execute(select(
+        func.count(JobApplication.id).label('total'),
+        *_status_columns(),
+    ).where(JobApplication.user_id == user_id)).one()
 
     stats = {
-        'total_applications': total,
-        'status_breakdown': {
-            'applied': status_dict.get('applied', 0),
-            'interviewing': status_dict.get('interviewing', 0),
-            'offered': status_dict.get('offered', 0),
-            'rejected': status_dict.get('rejected', 0),
-            'withdrawn': status_dict.get('withdrawn', 0),
-            'follow_up': status_dict.get('follow_up', 0),
-        },
+        'total_applications': counts.total,
+        'status_breakdown': {status: counts._mapping[status] for status in STATUS_BREAKDOWN},
     }
 
     return render_template('partials/status_breakdown.html', stats=stats)
@@ -4,16 +4,69 @@ from pathlib import Path
 basedir = Path(__file__).parent
 
 
+def normalize_database_url(url):
+    """Fix Render's postgres:// URLs to use the psycopg 3 driver."""
+    if url and url.startswith('postgres://'):
+        return url.replace('postgres://', 'postgresql+psycopg://', 1)
+    if url and url.startswith('postgresql://'):
+        return url.replace('postgresql://', 'postgresql+psycopg://', 1)
+    return url
+
+
+def engine_options(url):
+    """Driver options for an engine URL.
+
+    psycopg prepares a statement server-side once it has run
+    DB_PREPARE_THRESHOLD times on a connection, so hot fixed-text queries
+    (the dashboard aggregates) skip parse and plan on later calls. Set
+    DB_PREPARE_THRESHOLD=none behind a transaction-pooling PgBouncer.
+    """
+    if not url or not url.startswith('postgresql+psycopg://'):
+        return {}
+    threshold = os.environ.get('DB_PREPARE_THRESHOLD', '1')
+    return {'connect_args': {'prepare_threshold': None if threshold.lower() == 'none' else int(threshold)}}
+
+
 class Config:
     """Base configuration."""
     SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SINGLE_USER_MODE = os.environ.get('SINGLE_USER_MODE', 'true').lower() == 'true'
+    # Run db.create_all() on every app start (convenient locally; see `flask init-db`)
+    AUTO_CREATE_ALL = os.environ.get('AUTO_CREATE_ALL', 'true').lower() == 'true'
+    # Run the `flask init-db` index creation and data cleanups on app start (for hosts without a pre-deploy hook)
+    RUN_STARTUP_MIGRATIONS = os.environ.get('RUN_STARTUP_MIGRATIONS', 'false').lower() == 'true'
+    # Source of dashboard aggregates on PostgreSQL: 'live' tables, 'materialized'
+    # views (see `flask refresh-dashboard`) or trigger-maintained 'counters'
+    DASHBOARD_AGGREGATES = os.environ.get('DASHBOARD_AGGREGATES', 'live').lower()
+    # Redis response cache for dashboard endpoints; disabled when REDIS_URL is unset
+    REDIS_URL = os.environ.get('REDIS_URL')
+    DASHBOARD_CACHE_TTL = int(os.environ.get('DASHBOARD_CACHE_TTL', 300))
+    # Per-request query counts (X-Query-Count header); see app/query_counter.py
+    QUERY_COUNTING = os.environ.get('QUERY_COUNTING', 'false').lower() == 'true'
+    # Most queries each endpoint should need, whatever the number of rows or
+    # scanned emails; exceeding one logs a warning when QUERY_COUNTING is on
+    QUERY_BUDGETS = {
+        'api.list_applications': 4,
+        'api.list_interviews': 2,
+        'api.list_tags': 1,
+        'api.get_contacts': 2,
+        'api.sync_emails': 6,
+        'api.preview_response_emails': 4,
+        'api.scan_contacts_from_emails': 4,
+    }
+    # Optional read replica for the dashboard's read-only aggregates. Reads
+    # run in autocommit, so no BEGIN/COMMIT round-trips wrap each query.
+    _read_replica_url = normalize_database_url(os.environ.get('READ_REPLICA_URL'))
+    SQLALCHEMY_BINDS = {
+        'replica': {'url': _read_replica_url, 'isolation_level': 'AUTOCOMMIT', **engine_options(_read_replica_url)},
+    } if _read_replica_url else {}
 
 
 class DevelopmentConfig(Config):
     """Development configuration."""
     DEBUG = True
+    QUERY_COUNTING = os.environ.get('QUERY_COUNTING', 'true').lower() == 'true'
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         f'sqlite:///{basedir / "dev.db"}'
 
@@ -22,15 +75,13 @@ class ProductionConfig(Config):
     """Production configuration."""
     DEBUG = False
     SINGLE_USER_MODE = os.environ.get('SINGLE_USER_MODE', 'false').lower() == 'true'
+    AUTO_CREATE_ALL = os.environ.get('AUTO_CREATE_ALL', 'false').lower() == 'true'
 
     # Get database URL and fix Render's postgres:// to postgresql+psycopg://
-    _database_url = os.environ.get('DATABASE_URL')
-    if _database_url and _database_url.startswith('postgres://'):
-        _database_url = _database_url.replace('postgres://', 'postgresql+psycopg://', 1)
-    elif _database_url and _database_url.startswith('postgresql://'):
-        _database_url = _database_url.replace('postgresql://', 'postgresql+psycopg://', 1)
+    _database_url = normalize_database_url(os.environ.get('DATABASE_URL'))
 
     SQLALCHEMY_DATABASE_URI = _database_url or f'sqlite:///{basedir / "prod.db"}'
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(_database_url)
 
 
 class TestingConfig(Config):
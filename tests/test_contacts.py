@@ -0,0 +1,76 @@
+"""Tests for the contacts API."""
+
+import unittest
+
+from app import create_app
+from app.extensions import db
+from app.models import Contact, JobApplication, Tag
+from app.query_counter import init_query_counter
+
+USER = 'me@example.com'
+
+
+class GetContactsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.app.config['QUERY_COUNTING'] = True
+        init_query_counter(self.app)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        self.client = self.app.test_client()
+        with self.client.session_transaction() as sess:
+            sess['user_id'] = USER
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _pages(self, per_page):
+        """Follow next_cursor through every page, returning the ids of each."""
+        pages, after = [], None
+        while True:
+            params = {'per_page': per_page}
+            if after:
+                params['after'] = after
+            resp = self.client.get('/api/v1/contacts', query_string=params)
+            self.assertEqual(resp.status_code, 200)
+            body = resp.get_json()
+            pages.append([c['id'] for c in body['contacts']])
+            after = body['next_cursor']
+            if after is None:
+                return pages
+
+    def test_null_created_at_crosses_page_boundary(self):
+        contacts = [Contact(user_id=USER, name=f'Contact {i}') for i in range(3)]
+        db.session.add_all(contacts)
+        db.session.flush()
+        # The default only fires on insert, so clear it afterwards
+        contacts[1].created_at = None
+        db.session.commit()
+
+        pages = self._pages(per_page=1)
+
+        ids = [contact_id for page in pages for contact_id in page]
+        self.assertEqual(ids, sorted((c.id for c in contacts), reverse=True))
+        self.assertEqual(len(pages), 3)
+
+    def test_query_budget(self):
+        tag = Tag(user_id=USER, name='Remote')
+        for i in range(3):
+            application = JobApplication(user_id=USER, company_name=f'Company {i}', position='Engineer')
+            application.tags.append(tag)
+            db.session.add(Contact(user_id=USER, name=f'Contact {i}', application=application))
+        db.session.commit()
+
+        resp = self.client.get('/api/v1/contacts')
+
+        self.assertEqual(len(resp.get_json()['contacts']), 3)
+        budget = self.app.config['QUERY_BUDGETS']['api.get_contacts']
+        self.assertLessEqual(int(resp.headers['X-Query-Count']), budget)
+
+
+if __name__ == '__main__':
+    unittest.main()